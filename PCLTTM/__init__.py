@@ -1,11 +1,17 @@
-from typing import List, Optional, Dict, Set, Tuple
+from collections import deque
+from typing import Deque, Optional, Dict, Set, Tuple
 
 from PCLTTM.data_structures.face import Face
 
 from .retriangulator import Retriangulator
 from .data_structures import Vertex, Gate
 from .mesh import MeshTopology
-from .data_structures.constants import StateFlag, RetriangulationTag
+from .data_structures.constants import StateFlag, RetriangulationTag, PCLTTMConstants
+
+# Plain module-level aliases of the state flags used by the conquest loops,
+# so the hot path does not go through enum class attribute lookups.
+_FREE = StateFlag.Free
+_CONQUERED = StateFlag.Conquered
 
 
 class PCLTTM:
@@ -26,6 +32,23 @@ class PCLTTM:
     def set_vertex_state(self, v: Vertex, state: StateFlag) -> None:
         self.state_flags[v] = state
 
+    def snapshot(self) -> "PCLTTM":
+        """
+        Return an independent copy of the model, much cheaper than deepcopy:
+        only the topology containers, state flags and tags are copied.
+        The flags and tags are re-keyed on the snapshot's own vertices, so
+        iterating over them never yields a vertex bound to this mesh.
+        """
+        model = PCLTTM()
+        model.mesh = self.mesh.snapshot() if self.mesh is not None else None
+        # Vertex compares by position: look up the copy of each original vertex
+        by_vertex = {v: v for v in model.mesh.get_vertices()} if model.mesh is not None else {}
+        model.state_flags = {by_vertex.get(v, v): f for v, f in self.state_flags.items()}
+        model.retriangulator.retriangulation_tags = {
+            by_vertex.get(v, v): tag for v, tag in self.retriangulator.retriangulation_tags.items()
+        }
+        return model
+
     # ----------------------------------------------------------------------
     # Mesh loading
     # ----------------------------------------------------------------------
@@ -35,10 +58,23 @@ class PCLTTM:
         Parse an OBJ/OBJA file and initialize the mesh and states.
         """
         self.mesh = MeshTopology.from_obj_file(file)
-        for v in self.mesh.get_vertices():
-            self.state_flags[v] = StateFlag.Free
-            # default retriangulation tag
-            self.retriangulator.retriangulation_tags[v] = RetriangulationTag.Default
+        self.reset_states()
+
+    def reset_states(self) -> None:
+        """
+        Reset every vertex to Free with the default retriangulation tag, as after
+        parsing, so the in-memory mesh can go through another compress() pass.
+        The commit history is dropped as well: like a freshly parsed mesh, only
+        the initial empty baseline state is kept, so rollback() can no longer
+        return to a state committed before the reset.
+        Does nothing if no mesh is loaded.
+        """
+        if self.mesh is None:
+            return
+        self.mesh.committed_states = deque([MeshTopology.State()])
+        vertices = self.mesh.get_vertices()
+        self.state_flags = dict.fromkeys(vertices, StateFlag.Free)
+        self.retriangulator.retriangulation_tags = dict.fromkeys(vertices, RetriangulationTag.Default)
 
     # ----------------------------------------------------------------------
     # Main compression routine
@@ -75,7 +111,6 @@ class PCLTTM:
     def _can_remove_vertex(self, v: Vertex, valence, current_gate, patch_vertices) -> bool:
         if self.mesh is None:
             return False
-        import copy
         #mesh_aux = copy.deepcopy(self.mesh)
         
         ok = True
@@ -112,21 +147,27 @@ class PCLTTM:
         # ==================================================================
         # DECIMATION PHASE
         # ==================================================================
-        FiFo: List[Gate] = [initial_gate]
+        FiFo: Deque[Gate] = deque([initial_gate])
         conquered_faces: Set[Face] = set()
 
+        # Loop invariants hoisted out of the conquest loop
+        min_valence = PCLTTMConstants.MIN_VALENCE_DECIMATION
+        max_valence = PCLTTMConstants.MAX_VALENCE_DECIMATION
+        state_flags = self.state_flags
+
         iteration = 1
         while FiFo:
 
             #print("Remaining gates in FiFo:", len(FiFo))
-            current_gate = FiFo.pop(0)
-            if current_gate.to_face() in conquered_faces:
+            current_gate = FiFo.popleft()
+            gate_face = current_gate.to_face()
+            if gate_face in conquered_faces:
                 continue
 
             left_vertex, right_vertex = current_gate.edge
             center_vertex = current_gate.front_vertex
 
-            vertex_state = self.state_flags.get(center_vertex, StateFlag.Free)
+            vertex_state = state_flags.get(center_vertex, _FREE)
 
             # valence is taken from the mesh topology
             valence = center_vertex.valence()
@@ -140,13 +181,11 @@ class PCLTTM:
             # ------------------------------------------------------------------
             # PROPER PATCH / DECIMATION (for free vertices)
             # ------------------------------------------------------------------
-            if (vertex_state == StateFlag.Free and valence in [3, 4, 5, 6] 
+            if (vertex_state == _FREE and min_valence <= valence <= max_valence
                 and self._can_remove_vertex(center_vertex, valence, current_gate, patch_vertices)):
                 # Original logic: get patch around the center vertex
                 #print("Processing patch for vertex:", center_vertex, "valence:", valence, "with faces:")
-                for f in patch.faces:
-                    conquered_faces.add(f)
-                    #print("\t- ", f)
+                conquered_faces.update(patch.faces)
 
                 # Get output gates and ring vertices
                 out_gates = patch.output_gates(current_gate.edge)
@@ -161,8 +200,7 @@ class PCLTTM:
                     print(f"Error during retriangulation")
 
                 # Mark boundary vertices as conquered and enqueue gates
-                for vertex in patch_vertices:
-                    self.set_vertex_state(vertex, StateFlag.Conquered)
+                state_flags.update(dict.fromkeys(patch_vertices, _CONQUERED))
                 
                 #self.mesh.export_to_obj(f"decimation_step_{iteration_compress}.obj")
 
@@ -170,19 +208,18 @@ class PCLTTM:
             # NULL PATCH (for free vertices that cannot be decimated cleanly)
             # ------------------------------------------------------------------
             else:
-                if valence > 6:
+                if valence > max_valence:
                     self.retriangulator.retriangulation_tags[center_vertex] = RetriangulationTag.Plus
                 # We are here with a vertex that is still Free but not suitable
                 # for normal decimation (wrong valence or cannot be removed).
                 #print("NULL PATCH for vertex:", center_vertex)
-                conquered_faces.add(current_gate.to_face())
-                out_gates = current_gate.to_face().output_gates(current_gate.edge)
+                conquered_faces.add(gate_face)
+                out_gates = gate_face.output_gates(current_gate.edge)
 
             # Center vertex is now conquered (removed / retriangulated)
-            self.set_vertex_state(center_vertex, StateFlag.Conquered)
+            state_flags[center_vertex] = _CONQUERED
 
-            for gate in out_gates:
-                FiFo.append(gate)
+            FiFo.extend(out_gates)
 
             iteration += 1
         # end while
@@ -247,22 +284,25 @@ class PCLTTM:
         # ==================================================================
         # DECIMATION PHASE
         # ==================================================================
-        FiFo: List[Gate] = [initial_gate]
+        FiFo: Deque[Gate] = deque([initial_gate])
         conquered_faces: Set[Face] = set()
 
-        for v in self.state_flags.keys():
-            self.state_flags[v] = StateFlag.Free
+        state_flags = self.state_flags
+        state_flags.update(dict.fromkeys(state_flags, _FREE))
+
+        cleaning_valence = PCLTTMConstants.VALENCE_CLEANING
 
         while FiFo:
             #print("Remaining gates in FiFo:", len(FiFo))
-            current_gate = FiFo.pop(0)
-            if current_gate.to_face() in conquered_faces:
+            current_gate = FiFo.popleft()
+            gate_face = current_gate.to_face()
+            if gate_face in conquered_faces:
                 continue
 
             left_vertex, right_vertex = current_gate.edge
             center_vertex = current_gate.front_vertex
 
-            vertex_state = self.state_flags.get(center_vertex, StateFlag.Free)
+            vertex_state = state_flags.get(center_vertex, _FREE)
 
             # valence is taken from the mesh topology
             valence = center_vertex.valence()
@@ -276,13 +316,11 @@ class PCLTTM:
             # ------------------------------------------------------------------
             # PROPER PATCH / DECIMATION (for free vertices)
             # ------------------------------------------------------------------
-            if (vertex_state == StateFlag.Free and valence == 3 
+            if (vertex_state == _FREE and valence == cleaning_valence
                 and self._can_remove_vertex(center_vertex, valence, current_gate, patch_vertices)):
                 # Original logic: get patch around the center vertex
                 #print("Processing patch for vertex:", center_vertex, "valence:", valence, "with faces:")
-                for f in patch.faces:
-                    conquered_faces.add(f)
-                    #print("\t- ", f)
+                conquered_faces.update(patch.faces)
 
                 # Get output gates and ring vertices
                 out_gates_aux = patch.output_gates(current_gate.edge)
@@ -299,8 +337,7 @@ class PCLTTM:
                 )
 
                 # Mark boundary vertices as conquered and enqueue gates
-                for vertex in patch_vertices:
-                    self.set_vertex_state(vertex, StateFlag.Conquered)
+                state_flags.update(dict.fromkeys(patch_vertices, _CONQUERED))
 
             # ------------------------------------------------------------------
             # NULL PATCH (for free vertices that cannot be decimated cleanly)
@@ -309,12 +346,11 @@ class PCLTTM:
                 # We are here with a vertex that is still Free but not suitable
                 # for normal decimation (wrong valence or cannot be removed).
                 #print("NULL PATCH for vertex:", center_vertex)
-                conquered_faces.add(current_gate.to_face())
-                out_gates = current_gate.to_face().output_gates(current_gate.edge)
+                conquered_faces.add(gate_face)
+                out_gates = gate_face.output_gates(current_gate.edge)
 
             # Center vertex is now conquered (removed / retriangulated)
-            self.set_vertex_state(center_vertex, StateFlag.Conquered)
+            state_flags[center_vertex] = _CONQUERED
 
-            for gate in out_gates:
-                FiFo.append(gate)
+            FiFo.extend(out_gates)
         # end while
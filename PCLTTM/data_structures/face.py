@@ -4,12 +4,17 @@ from typing import List, Tuple
 
 
 class Face:
+    __slots__ = ("vertices", "mesh", "_key", "_hash")
+
     def __init__(self, vertices: Tuple[Vertex, Vertex, Vertex], mesh=None):
         if vertices is None:
             print("Warning: Face created with None vertices")
             raise ValueError("Vertices must not be None")
         self.vertices = vertices  # (v1, v2, v3)
         self.mesh = mesh
+        # Orientation-independent key, computed once (faces are used as dict/set keys)
+        self._key = frozenset(vertices)
+        self._hash = hash(self._key)
 
     # Face related functions
     def edges(
@@ -19,10 +24,13 @@ class Face:
         return ((v1, v2), (v2, v3), (v3, v1))
 
     def next_vertex(self, edge: Tuple[Vertex, Vertex]) -> Vertex | None:
-        if edge[0] not in self.vertices or edge[1] not in self.vertices:
+        vertices = self.vertices
+        if edge[0] not in vertices or edge[1] not in vertices:
             return None  # Invalid edge for this face
 
-        return next(v for v in self.vertices if v != edge[0] and v != edge[1])
+        # Tuple containment checks identity before calling Vertex.__eq__,
+        # which is the common case for vertices coming from the same mesh.
+        return next(v for v in vertices if v not in edge)
 
     def to_gate(self, direction_vertex: Vertex) -> "Gate | None":
         if direction_vertex not in self.vertices:
@@ -107,10 +115,10 @@ class Face:
 
     def __hash__(self):
         # Order-independent hash
-        return hash(frozenset(self.vertices))
+        return self._hash
 
     def __eq__(self, other):
-        return isinstance(other, Face) and set(self.vertices) == set(other.vertices)
+        return isinstance(other, Face) and self._key == other._key
 
     def __repr__(self):
         return "(" + ", ".join([str(v) for v in self.vertices]) + ")"
@@ -3,6 +3,9 @@ from typing import Tuple
 
 
 class Gate:
+    # Gates are created by the thousands during conquest: no per-instance __dict__
+    __slots__ = ("edge", "front_vertex", "mesh")
+
     def __init__(self, edge: Tuple[Vertex, Vertex], front_vertex: Vertex, mesh=None):
         self.edge = edge  # (v_left, v_right)
         self.front_vertex = front_vertex
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
 
 from .vertex import Vertex
 
@@ -10,6 +10,9 @@ class Patch:
     Patch of faces around a center vertex.
     """
 
+    # One Patch is built per visited vertex: slots avoid a __dict__ per instance
+    __slots__ = ("center_vertex", "faces", "mesh")
+
     def __init__(self, center_vertex: Vertex, faces: List["Face"], mesh=None):
         self.center_vertex = center_vertex
         self.faces: List["Face"] = faces
@@ -80,6 +83,14 @@ class Patch:
         remaining_faces.remove(current_face)
         sequence: List[Vertex] = [starting_edge[0], starting_edge[1]]
 
+        # Index the faces around the center by vertex once, instead of
+        # rescanning every remaining face at each step of the walk.
+        faces_by_vertex: Dict[Vertex, List["Face"]] = {}
+        for f in remaining_faces:
+            if self.center_vertex in f.vertices:
+                for v in f.vertices:
+                    faces_by_vertex.setdefault(v, []).append(f)
+
         current_vertex = starting_edge[1]
 
         # Safety guard to avoid infinite loops in corrupted meshes
@@ -88,9 +99,8 @@ class Patch:
         for _ in range(max_steps):
             # Find a face incident to both current_vertex and center_vertex
             face = next((
-                    f for f in remaining_faces
-                    if (current_vertex in f.vertices)
-                    and (self.center_vertex in f.vertices)
+                    f for f in faces_by_vertex.get(current_vertex, ())
+                    if f in remaining_faces
                 ), None)
 
             if face is None:
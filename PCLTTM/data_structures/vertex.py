@@ -6,9 +6,13 @@ if TYPE_CHECKING:
 
 
 class Vertex:
+    __slots__ = ("position", "mesh", "_hash")
+
     def __init__(self, position: Tuple[float, float, float], mesh=None):
         self.position = position
         self.mesh = mesh
+        # The position never changes after construction: hash computed once
+        self._hash = hash(position)
 
     # Mesh related functions
     def valence(self) -> int:
@@ -28,7 +32,7 @@ class Vertex:
         return self.position < other.position
 
     def __hash__(self):
-        return hash(self.position)
+        return self._hash
 
     def __eq__(self, other):
         return isinstance(other, Vertex) and self.position == other.position
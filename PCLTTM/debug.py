@@ -0,0 +1,13 @@
+import os
+
+import numpy as np
+
+
+def enable_debug_checks() -> None:
+    """
+    Make numpy raise on invalid operations (NaN produced by 0/0, sqrt(-1), ...)
+    when the PCLTTM_DEBUG environment variable is set to 1.
+    Off by default: normal runs keep numpy's default error handling.
+    """
+    if os.environ.get("PCLTTM_DEBUG") == "1":
+        np.seterr(invalid='raise')
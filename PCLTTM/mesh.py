@@ -1,8 +1,10 @@
 from collections import deque
-from copy import deepcopy
+from operator import attrgetter
 import random
 from typing import Dict, List, Optional, Set, Tuple
 
+import numpy as np
+
 from .data_structures import Vertex, Face, Gate, Patch
 from .obja_parser import ObjaReader, ObjaWriter
 
@@ -27,6 +29,14 @@ class MeshTopology:
             #   (3rd vertex of left face [from->to], 3rd vertex of right face [to->from])
             self.orientations = dict()
 
+        def copy(self) -> "MeshTopology.State":
+            # Structural copy: adjacency sets are duplicated, Vertex objects and
+            # (immutable) orientation tuples are shared
+            state = MeshTopology.State()
+            state.vertex_connections = {v: set(n) for v, n in self.vertex_connections.items()}
+            state.orientations = dict(self.orientations)
+            return state
+
         # We make two hypotheses for difference():
         # - self is one step more compressed than previous_state
         # - self is included in previous_state, and there's more vertices in previous_state
@@ -43,8 +53,11 @@ class MeshTopology:
 
             # edges that were deleted
             difference_in_edges = set(self.orientations.keys()).difference(set(previous_state.orientations.keys()))
+            # The reverse edge carries the same two faces: handle it only once
+            handled_edges = set()
             for edge in difference_in_edges:
-                if (edge[1], edge[0]) not in faces_to_remove:
+                if edge not in handled_edges:
+                    handled_edges.add((edge[1], edge[0]))
                     adjacent_vertices = self.orientations[edge]
                     faces_to_remove.append(Face((edge[0], edge[1], adjacent_vertices[0])))
                     faces_to_remove.append(Face((edge[1], edge[0], adjacent_vertices[1])))
@@ -77,19 +90,95 @@ class MeshTopology:
         """
         reader = ObjaReader()
         mesh = MeshTopology()
+        faces: List[Face] = []
         for elem in reader.parse_file(file_path):
             if isinstance(elem, Vertex):
                 mesh.add_vertex(elem)
             elif isinstance(elem, Face):
-                for edge in elem.edges():
-                    mesh.add_edge(*edge)
-                    mesh.set_orientation(edge, (elem.next_vertex(edge) , None))
+                faces.append(elem)
+        mesh._build_adjacency(faces)
         return mesh
 
     def __init__(self):
         self.active_state = MeshTopology.State()
         # Seed committed_states with an initial empty state so commit() always has a "previous" state.
-        self.committed_states = deque([deepcopy(self.active_state)])
+        self.committed_states = deque([self.active_state.copy()])
+
+    def _build_adjacency(self, faces: List[Face]) -> None:
+        """
+        Fill vertex connections and edge orientations for a batch of faces.
+
+        The result is the same as calling add_edge() and set_orientation()
+        for every edge of every face, in file order, including the insertion
+        order of the dicts. When every half-edge belongs to exactly one face,
+        each oriented edge (from, to) is packed into a uint64 key
+        (from << 32 | to) and half-edges and their twins are matched with one
+        sort instead of per-edge dict probes. Non-manifold or inconsistently
+        oriented faces (a half-edge shared by several faces), and faces using
+        vertices that are not in the mesh, go through the per-edge calls.
+        """
+        if not faces:
+            return
+
+        vertices = list(self.active_state.vertex_connections.keys())
+        index = {v: i for i, v in enumerate(vertices)}
+        try:
+            face_verts = np.array(
+                [[index[v] for v in f.vertices] for f in faces], dtype=np.uint64
+            )
+        except KeyError:
+            face_verts = None
+
+        shift = np.uint64(32)
+        if face_verts is not None:
+            # Half-edges (v1, v2), (v2, v3), (v3, v1), with their left vertex
+            keys = ((face_verts << shift) | face_verts[:, [1, 2, 0]]).ravel()
+            lefts = face_verts[:, [2, 0, 1]].ravel().astype(np.int64)
+            order = np.argsort(keys, kind="stable")
+            sorted_keys = keys[order]
+            if np.any(sorted_keys[1:] == sorted_keys[:-1]):
+                face_verts = None
+
+        if face_verts is None:
+            for face in faces:
+                for edge in face.edges():
+                    self.add_edge(*edge)
+                    self.set_orientation(edge, (face.next_vertex(edge), None))
+            return
+
+        # Connections, inserted in the same order as per-face add_edge() calls
+        connections = [self.active_state.vertex_connections[v] for v in vertices]
+        for a, b, c in face_verts.tolist():
+            connections[a].add(vertices[b])
+            connections[b].add(vertices[a])
+            connections[b].add(vertices[c])
+            connections[c].add(vertices[b])
+            connections[c].add(vertices[a])
+            connections[a].add(vertices[c])
+
+        # set_orientation() on the first edge of a face creates its six
+        # half-edges in this order: (v1, v2), (v2, v1), (v2, v3), (v3, v1),
+        # (v3, v2), (v1, v3). Keep the first occurrence of each key.
+        seq = ((face_verts[:, [0, 1, 1, 2, 2, 0]] << shift) | face_verts[:, [1, 0, 2, 0, 1, 2]]).ravel()
+        _, first = np.unique(seq, return_index=True)
+        edge_keys = seq[np.sort(first)]
+
+        def left_of(query: np.ndarray) -> np.ndarray:
+            # Left vertex of each half-edge key, -1 if no face uses it
+            pos = np.minimum(np.searchsorted(sorted_keys, query), len(sorted_keys) - 1)
+            return np.where(sorted_keys[pos] == query, lefts[order[pos]], -1)
+
+        mask = np.uint64(0xFFFFFFFF)
+        from_idx = (edge_keys >> shift).astype(np.int64)
+        to_idx = (edge_keys & mask).astype(np.int64)
+        left = left_of(edge_keys)
+        right = left_of((edge_keys << shift) | (edge_keys >> shift))
+
+        # Index -1 (no face on that side) maps to None
+        vertices.append(None)
+        orientations = self.active_state.orientations
+        for a, b, l, r in zip(from_idx.tolist(), to_idx.tolist(), left.tolist(), right.tolist()):
+            orientations[(vertices[a], vertices[b])] = (vertices[l], vertices[r])
 
     # ----------------------------------------------------------------------
     # Transaction helpers (commit / rollback)
@@ -102,7 +191,7 @@ class MeshTopology:
         """
         last_state = self.committed_states[-1]
         diff = self.active_state.compression_difference(last_state)
-        self.committed_states.append(deepcopy(self.active_state))
+        self.committed_states.append(self.active_state.copy())
         return diff
 
     def rollback(self) -> bool:
@@ -113,11 +202,46 @@ class MeshTopology:
         if len(self.committed_states) > 1:
             # Pop current snapshot and revert to the one before it.
             self.committed_states.pop()
-            self.active_state = deepcopy(self.committed_states[-1])
+            self.active_state = self.committed_states[-1].copy()
             return True
         return False
         # else: nothing to rollback
 
+    def snapshot(self) -> "MeshTopology":
+        """
+        Return an independent copy of the current topology, without going through
+        deepcopy. Vertices are re-created and bound to the copy, so
+        Vertex.valence() & co. query the snapshot and not this mesh.
+        Only the active state is copied: the commit history is not carried over,
+        the copy starts with the active state as its only committed state.
+        """
+        mesh = MeshTopology.__new__(MeshTopology)
+        rebound: Dict[Vertex, Vertex] = {}
+
+        def rebind(v: Optional[Vertex]) -> Optional[Vertex]:
+            if v is None:
+                return None
+            new_v = rebound.get(v)
+            if new_v is None:
+                new_v = rebound[v] = Vertex(v.position, mesh)
+            return new_v
+
+        def copy_state(state: "MeshTopology.State") -> "MeshTopology.State":
+            copied = MeshTopology.State()
+            copied.vertex_connections = {
+                rebind(v): {rebind(n) for n in neighbors}
+                for v, neighbors in state.vertex_connections.items()
+            }
+            copied.orientations = {
+                (rebind(a), rebind(b)): (rebind(l), rebind(r))
+                for (a, b), (l, r) in state.orientations.items()
+            }
+            return copied
+
+        mesh.active_state = copy_state(self.active_state)
+        mesh.committed_states = deque([mesh.active_state.copy()])
+        return mesh
+
     # ----------------------------------------------------------------------
     # Vertex management
     # ----------------------------------------------------------------------
@@ -143,13 +267,11 @@ class MeshTopology:
         """
         A vertex can be removed only if all its neighbors will still have valence > 3 after removal.
         """
-        if vertex not in self.active_state.vertex_connections:
+        connections = self.active_state.vertex_connections
+        if vertex not in connections:
             return False
 
-        return all(
-            len(self.active_state.vertex_connections[neighbor]) > 3
-            for neighbor in self.active_state.vertex_connections[vertex]
-        )
+        return all(len(connections[n]) > 3 for n in connections[vertex])
 
     def remove_vertex(self, vertex: Vertex, force: bool = False):
         """
@@ -161,20 +283,21 @@ class MeshTopology:
         if vertex not in self.active_state.vertex_connections:
             return
 
+        connections = self.active_state.vertex_connections
+        orientations = self.active_state.orientations
+
         # Remove vertex from all neighbors
-        neighbors = list(self.active_state.vertex_connections[vertex])
+        neighbors = list(connections[vertex])
         for neighbor in neighbors:
-            if neighbor in self.active_state.vertex_connections:
-                self.active_state.vertex_connections[neighbor].discard(vertex)
+            if neighbor in connections:
+                connections[neighbor].discard(vertex)
 
             # Clean up edge orientations if present
-            if (vertex, neighbor) in self.active_state.orientations:
-                del self.active_state.orientations[(vertex, neighbor)]
-            if (neighbor, vertex) in self.active_state.orientations:
-                del self.active_state.orientations[(neighbor, vertex)]
+            orientations.pop((vertex, neighbor), None)
+            orientations.pop((neighbor, vertex), None)
 
         # Finally remove the vertex itself
-        del self.active_state.vertex_connections[vertex]
+        del connections[vertex]
 
     # ----------------------------------------------------------------------
     # Edge management
@@ -185,13 +308,11 @@ class MeshTopology:
         Add an undirected edge between fromV and toV.
         Orientation must be set later explicitly via set_orientation().
         """
-        if (
-            fromV not in self.active_state.vertex_connections
-            or toV not in self.active_state.vertex_connections
-        ):
-            return False    
-        self.active_state.vertex_connections[fromV].add(toV)
-        self.active_state.vertex_connections[toV].add(fromV)
+        connections = self.active_state.vertex_connections
+        if fromV not in connections or toV not in connections:
+            return False
+        connections[fromV].add(toV)
+        connections[toV].add(fromV)
         return True
 
     def can_remove_edge(self, fromV: Vertex, toV: Vertex) -> bool:
@@ -213,16 +334,16 @@ class MeshTopology:
             return
 
         # Clean up orientation for this edge if exists
-        if (fromV, toV) in self.active_state.orientations:
-            del self.active_state.orientations[(fromV, toV)]
-        if (toV, fromV) in self.active_state.orientations:
-            del self.active_state.orientations[(toV, fromV)]
+        orientations = self.active_state.orientations
+        orientations.pop((fromV, toV), None)
+        orientations.pop((toV, fromV), None)
 
         # Remove from adjacency lists
-        if fromV in self.active_state.vertex_connections:
-            self.active_state.vertex_connections[fromV].discard(toV)
-        if toV in self.active_state.vertex_connections:
-            self.active_state.vertex_connections[toV].discard(fromV)
+        connections = self.active_state.vertex_connections
+        if fromV in connections:
+            connections[fromV].discard(toV)
+        if toV in connections:
+            connections[toV].discard(fromV)
 
     def remove_edge(
         self,
@@ -262,16 +383,18 @@ class MeshTopology:
     def set_orientation(self, from_to: Tuple[Vertex, Vertex], left_right: Tuple[Vertex, Vertex]) -> bool:
         
         fromV, toV = from_to
-        if (fromV not in self.active_state.vertex_connections
-            or toV not in self.active_state.vertex_connections):
+        connections = self.active_state.vertex_connections
+        if fromV not in connections or toV not in connections:
             return False
+
+        orientations = self.active_state.orientations
         
         
         third_vertex, other_vertex = left_right
         if third_vertex is None:
-            third_vertex = self.active_state.orientations.get(from_to, (None, None))[0]
+            third_vertex = orientations.get(from_to, (None, None))[0]
         if other_vertex is None:
-            other_vertex = self.active_state.orientations.get(from_to, (None, None))[1]
+            other_vertex = orientations.get(from_to, (None, None))[1]
         
         opposite_side = (toV, fromV)
         #if from_to in self.active_state.orientations:
@@ -279,31 +402,31 @@ class MeshTopology:
         #if opposite_side in self.active_state.orientations:
         #    print("Current opposite orientation:", self.active_state.orientations[opposite_side])
 
-        self.active_state.orientations[from_to] = (third_vertex, other_vertex)
-        self.active_state.orientations[opposite_side] = (other_vertex, third_vertex)
+        orientations[from_to] = (third_vertex, other_vertex)
+        orientations[opposite_side] = (other_vertex, third_vertex)
 
         #print("Set orientation:", from_to, "->", self.active_state.orientations[from_to])
         #print("Set opposite orientation:", opposite_side, "->", self.active_state.orientations[opposite_side])
-        temp1 = self.active_state.orientations.get((toV, third_vertex), (None, None))
-        temp2 = self.active_state.orientations.get((third_vertex, fromV), (None, None))
-        temp3 = self.active_state.orientations.get((other_vertex, toV), (None, None))
-        temp4 = self.active_state.orientations.get((fromV, other_vertex), (None, None))
-        self.active_state.orientations[(toV, third_vertex)] = (fromV, temp1[1])
-        self.active_state.orientations[(third_vertex, fromV)] = (toV, temp2[1])
+        temp1 = orientations.get((toV, third_vertex), (None, None))
+        temp2 = orientations.get((third_vertex, fromV), (None, None))
+        temp3 = orientations.get((other_vertex, toV), (None, None))
+        temp4 = orientations.get((fromV, other_vertex), (None, None))
+        orientations[(toV, third_vertex)] = (fromV, temp1[1])
+        orientations[(third_vertex, fromV)] = (toV, temp2[1])
         if other_vertex is not None:
-            self.active_state.orientations[(other_vertex, toV)] = (fromV, temp3[1])
-            self.active_state.orientations[(fromV, other_vertex)] = (toV, temp4[1])
+            orientations[(other_vertex, toV)] = (fromV, temp3[1])
+            orientations[(fromV, other_vertex)] = (toV, temp4[1])
         
         #The other side
-        temp5 = self.active_state.orientations.get((third_vertex,toV), (None, None))
-        temp6 = self.active_state.orientations.get((fromV,third_vertex), (None, None))
-        temp7 = self.active_state.orientations.get((toV,other_vertex), (None, None))
-        temp8 = self.active_state.orientations.get((other_vertex,fromV), (None, None))
-        self.active_state.orientations[(third_vertex,toV)] = (temp5[0], fromV)
-        self.active_state.orientations[(fromV,third_vertex)] = (temp6[0],toV )
+        temp5 = orientations.get((third_vertex,toV), (None, None))
+        temp6 = orientations.get((fromV,third_vertex), (None, None))
+        temp7 = orientations.get((toV,other_vertex), (None, None))
+        temp8 = orientations.get((other_vertex,fromV), (None, None))
+        orientations[(third_vertex,toV)] = (temp5[0], fromV)
+        orientations[(fromV,third_vertex)] = (temp6[0],toV )
         if other_vertex is not None:
-            self.active_state.orientations[(toV,other_vertex)] = (temp7[0],fromV)
-            self.active_state.orientations[(other_vertex,fromV)] = (temp8[0],toV)
+            orientations[(toV,other_vertex)] = (temp7[0],fromV)
+            orientations[(other_vertex,fromV)] = (temp8[0],toV)
         
         return True
 
@@ -321,10 +444,7 @@ class MeshTopology:
         self,
         oriented_edge: Tuple[Vertex, Vertex]
     ) -> Tuple[Optional[Vertex], Optional[Vertex]]:
-        if oriented_edge not in self.active_state.orientations:
-            return (None, None)
-
-        return self.active_state.orientations[oriented_edge]
+        return self.active_state.orientations.get(oriented_edge, (None, None))
 
     # Left face is the one in the orientation of from -> to, right is to -> from
     def get_oriented_faces(
@@ -347,30 +467,51 @@ class MeshTopology:
         """
         Return all faces around a vertex, based on oriented edges.
         """
-        if fromV not in self.active_state.vertex_connections:
+        neighbors = self.active_state.vertex_connections.get(fromV)
+        if neighbors is None:
             return set()
 
+        # Read the orientation table directly rather than going through
+        # get_oriented_faces() -> get_oriented_vertices() for every neighbor.
+        orientations = self.active_state.orientations
         faces: Set[Face] = set()
-        valence = self.get_valence(fromV)
-        neighbors = self.active_state.vertex_connections[fromV]
+        valence = len(neighbors)
 
         for toV in neighbors:
             if valence == len(faces):
                 break
 
-            connected_faces = self.get_oriented_faces((fromV, toV))
-            if connected_faces == (None, None):
+            left_vertex, right_vertex = orientations.get((fromV, toV), (None, None))
+            if left_vertex is None and right_vertex is None:
                 print("Warning: Missing face for edge", (fromV, toV))
                 continue
 
-            for face in connected_faces:
-                if face is not None:
-                    faces.add(face)
-                else:
-                    print("MeshTopology: incomplete face information detected.")
+            if left_vertex is not None:
+                faces.add(Face((fromV, toV, left_vertex), self))
+            else:
+                print("MeshTopology: incomplete face information detected.")
+
+            if right_vertex is not None:
+                faces.add(Face((toV, fromV, right_vertex), self))
+            else:
+                print("MeshTopology: incomplete face information detected.")
 
         return faces
 
+    def get_all_faces(self) -> List[Face]:
+        """
+        Return every face of the mesh once, in a single pass over the oriented
+        edges instead of gathering get_faces() around each vertex (which visits
+        every face three times).
+        """
+        faces: Dict[Face, None] = {}
+        for (fromV, toV), (left_vertex, right_vertex) in self.active_state.orientations.items():
+            if left_vertex is not None:
+                faces.setdefault(Face((fromV, toV, left_vertex), self))
+            if right_vertex is not None:
+                faces.setdefault(Face((toV, fromV, right_vertex), self))
+        return list(faces)
+
     # Warning: faces are returned in a non-deterministic order
     def get_patch(self, vertex: Vertex) -> Optional[Patch]:
         if vertex not in self.active_state.vertex_connections:
@@ -432,7 +573,7 @@ class MeshTopology:
         WE HAVE TO RESPECT THE ORIENTATION GIVEN BY THE MESH
         """
         # Collect vertices
-        vertices = sorted(self.get_vertices())
+        vertices = sorted(self.get_vertices(), key=attrgetter("position"))
         indices = {v: i + 1 for i, v in enumerate(vertices)}
         # mapping position tuple -> index for faces that store plain position tuples
         pos_to_index = {v.position: i + 1 for i, v in enumerate(vertices)}
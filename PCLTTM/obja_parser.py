@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 
 import random
+import re
 from .data_structures import Face, Vertex
 
 
@@ -8,6 +9,9 @@ from .data_structures import Face, Vertex
     OBJA file reader & writer.
 """
 
+# Vertex index of a face element "i", "i/t", "i//n" or "i/t/n", on raw bytes
+FACE_INDEX_RE = re.compile(rb"(-?\d+)(?:/\S*)?")
+
 
 class ObjaReader:
     """
@@ -1,30 +1,28 @@
 # PCLTTM/obja_writer.py
 
+from operator import attrgetter
+
 from .mesh import MeshTopology
 
 def write_obja_from_mesh(mesh: MeshTopology, path: str) -> None:
-    vertices = sorted(mesh.get_vertices())
+    vertices = sorted(mesh.get_vertices(), key=attrgetter("position"))  # meme ordre que Vertex.__lt__
     indices = {v: i for i, v in enumerate(vertices)}  # 0-based pour l’instant
 
-    with open(path, "w") as f:
-        # 1) sommets
-        for v in vertices:
-            x, y, z = v.position
-            f.write(f"v {x} {y} {z}\n")
+    # 1) sommets
+    lines = [f"v {x} {y} {z}\n" for x, y, z in (v.position for v in vertices)]
 
-        # 2) faces uniques
-        seen = set()
-        for v in vertices:
-            for face in mesh.get_faces(v):
-                if face is None:
-                    continue
-                vs = tuple(face.vertices)
-                key = frozenset(vs)
-                if key in seen:
-                    continue
-                seen.add(key)
+    # 2) faces uniques
+    seen = set()
+    for v in vertices:
+        for face in mesh.get_faces(v):
+            if face is None:
+                continue
+            seen.add(frozenset(face.vertices))
 
-        for face_verts in seen:
-            sorted_verts = sorted(face_verts, key=lambda vv: indices[vv])
-            i, j, k = [indices[vv] + 1 for vv in sorted_verts]  # +1 car JS fait -1
-            f.write(f"f {i} {j} {k}\n")
+    for face_verts in seen:
+        i, j, k = sorted(indices[vv] + 1 for vv in face_verts)  # +1 car JS fait -1
+        lines.append(f"f {i} {j} {k}\n")
+
+    # Une seule écriture bufferisée au lieu d'un write() par ligne
+    with open(path, "w") as f:
+        f.writelines(lines)
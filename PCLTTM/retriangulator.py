@@ -1,3 +1,4 @@
+from itertools import cycle
 from typing import List, Tuple, Dict
 
 from PCLTTM.data_structures.patch import Patch
@@ -7,6 +8,54 @@ from .data_structures.gate import Gate
 from .data_structures.constants import RetriangulationTag
 
 
+# ============================================================================
+# RETRIANGULATION TABLE (figure 9)
+# ============================================================================
+# (left_tag, right_tag) -> valence -> (edges_to_add, orientations_to_set),
+# exprimés en indices dans la liste orientée des sommets du patch (pov).
+# Une orientation ((i, j), (k, l)) donne l'arête (pov[i], pov[j]) avec
+# pov[k] à gauche et pov[l] à droite (l = None : côté droit inchangé).
+_PLUS, _MINUS = RetriangulationTag.Plus, RetriangulationTag.Minus
+
+_RETRIANGULATION_TABLE = {
+    (_PLUS, _MINUS): {
+        3: ((), (((0, 1), (2, None)),)),
+        # priorité au '-' de droite → diagonale (1,3)
+        4: (((0, 2),), (((0, 2), (3, 1)),)),
+        # priorité au '-' de droite → éventail depuis 4
+        5: (((0, 2), (2, 4)), (((0, 2), (4, 1)), ((2, 4), (0, 3)))),
+        # priorité au '-' de droite → éventail depuis 5
+        6: (((0, 2), (0, 4), (4, 2)), (((2, 0), (1, 4)), ((0, 4), (5, 2)), ((4, 2), (3, 0)))),
+    },
+    (_MINUS, _PLUS): {
+        3: ((), (((0, 1), (2, None)),)),
+        # priorité au '-' de gauche → diagonale (0,2)
+        4: (((1, 3),), (((1, 3), (0, 2)),)),
+        # priorité au '-' de gauche → éventail depuis 0
+        5: (((2, 4), (1, 4)), (((4, 1), (2, 0)), ((4, 2), (3, 1)))),
+        # priorité au '-' de gauche → éventail depuis 0
+        6: (((1, 3), (3, 5), (5, 1)), (((5, 1), (3, 0)), ((1, 3), (5, 2)), ((3, 5), (1, 4)))),
+    },
+    (_PLUS, _PLUS): {
+        3: ((), (((0, 1), (2, None)),)),
+        # gate ++ OU gate -- : priorité côté droit → diagonale (1,3)
+        4: (((1, 3),), (((1, 3), (0, 2)),)),
+        # ++ ou -- : priorité côté droit → éventail depuis 4
+        5: (((1, 3), (0, 3)), (((1, 3), (0, 2)), ((0, 3), (4, 1)))),
+        # ++ ou -- : priorité côté droit → éventail depuis 5
+        6: (((1, 3), (3, 5), (1, 5)), (((1, 5), (0, 3)), ((3, 1), (2, 5)), ((5, 3), (4, 1)))),
+    },
+    (_MINUS, _MINUS): {
+        3: ((), (((0, 1), (2, None)),)),
+        4: (((0, 2),), (((0, 2), (3, 1)),)),
+        5: (((0, 2), (4, 2)), (((2, 0), (1, 4)), ((0, 2), (4, 1)))),
+        6: (((0, 2), (4, 2), (0, 4)), (((2, 0), (1, 4)), ((0, 4), (5, 2)), ((4, 2), (3, 0)))),
+    },
+}
+# Toute autre combinaison de tags retombe sur le cas (-, -)
+_DEFAULT_RETRIANGULATION = _RETRIANGULATION_TABLE[(_MINUS, _MINUS)]
+
+
 class Retriangulator:
     """
     Retriangulation 'table' (figure 9) d'un patch polygonal (valence 3..6)
@@ -66,13 +115,15 @@ class Retriangulator:
     def tag_propagation(self, mesh, vertex_to_tag: List[Vertex], starting_tag: RetriangulationTag):
         # l'idée est d'alterner les + et les -, mais le côté droit de la gate d'entrée est toujours prioritaire.
         # Normalise les tags d'entrée pour éviter les valeurs Default qui provoquent un KeyError.
-        tags = [RetriangulationTag.Minus, RetriangulationTag.Plus]
-        index = tags.index(starting_tag) if starting_tag in tags else 0
-        for vertex in vertex_to_tag:
-            index = (index + 1) % len(tags)
-            if self.retriangulation_tags[vertex] == RetriangulationTag.Default:
-                #print("Vertex", vertex, "tagged as", tags[index])
-                self.retriangulation_tags[vertex] = tags[index]
+        # Le premier sommet prend le tag opposé à starting_tag ('+' si starting_tag est Default),
+        # puis on alterne selon la parité de la position : un seul update du dict.
+        pattern = (_MINUS, _PLUS) if starting_tag == _PLUS else (_PLUS, _MINUS)
+        tags = self.retriangulation_tags
+        tags.update({
+            vertex: tag
+            for vertex, tag in zip(vertex_to_tag, cycle(pattern))
+            if tags[vertex] == RetriangulationTag.Default
+        })
         
     def triangulate_table(
         self, mesh, front_vertex: Vertex,
@@ -93,104 +144,15 @@ class Retriangulator:
         pov = patch_oriented_vertex  # alias court
         #print(pov)
         try :
-            edges_to_add = []
-            orientations_to_set = []
-            match (left_tag, right_tag):
-                case (RetriangulationTag.Plus, RetriangulationTag.Minus):
-                    match valence:
-                        case 3:
-                            orientations_to_set.append(((pov[0], pov[1]), (pov[2], None)))
-                        case 4:
-                            # prioritÃ© au '-' de droite â†’ diagonale (1,3)
-                            edges_to_add.append((pov[0], pov[2]))
-                            orientations_to_set.append(((pov[0], pov[2]), (pov[3], pov[1])))
-                        case 5:
-                            # prioritÃ© au '-' de droite â†’ Ã©ventail depuis 4
-                            edges_to_add.append((pov[0], pov[2]))
-                            edges_to_add.append((pov[2], pov[4]))
-                            orientations_to_set.append(((pov[0], pov[2]), (pov[4], pov[1])))
-                            orientations_to_set.append(((pov[2], pov[4]), (pov[0], pov[3])))
-                        case 6:
-                            # prioritÃ© au '-' de droite â†’ Ã©ventail depuis 5
-                            edges_to_add.append((pov[0], pov[2]))
-                            edges_to_add.append((pov[0], pov[4]))
-                            edges_to_add.append((pov[4], pov[2]))
-                            orientations_to_set.append(((pov[2], pov[0]), (pov[1], pov[4])))
-                            orientations_to_set.append(((pov[0], pov[4]), (pov[5], pov[2])))
-                            orientations_to_set.append(((pov[4], pov[2]), (pov[3], pov[0])))
-                        case _:
-                            pass
-                case (RetriangulationTag.Minus, RetriangulationTag.Plus):
-                    match valence:
-                        case 3:
-                            orientations_to_set.append(((pov[0], pov[1]), (pov[2], None)))
-                        case 4:
-                            # prioritÃ© au '-' de gauche â†’ diagonale (0,2)
-                            
-                            edges_to_add.append((pov[1], pov[3]))
-                            orientations_to_set.append(((pov[1], pov[3]), (pov[0], pov[2])))
-                        case 5:
-                            # prioritÃ© au '-' de gauche â†’ Ã©ventail depuis 0
-                            edges_to_add.append((pov[2], pov[4]))
-                            edges_to_add.append((pov[1], pov[4]))
-                            orientations_to_set.append(((pov[4], pov[1]), (pov[2], pov[0])))
-                            orientations_to_set.append(((pov[4], pov[2]), (pov[3], pov[1])))
-                        case 6:
-                            # prioritÃ© au '-' de gauche â†’ Ã©ventail depuis 0
-                            edges_to_add.append((pov[1], pov[3]))
-                            edges_to_add.append((pov[3], pov[5]))
-                            edges_to_add.append((pov[5], pov[1]))
-                            orientations_to_set.append(((pov[5], pov[1]), (pov[3], pov[0])))
-                            orientations_to_set.append(((pov[1], pov[3]), (pov[5], pov[2])))
-                            orientations_to_set.append(((pov[3], pov[5]), (pov[1], pov[4])))
-                        case _:
-                            pass
-                case (RetriangulationTag.Plus, RetriangulationTag.Plus):
-                    match valence:
-                        case 3:
-                            orientations_to_set.append(((pov[0], pov[1]), (pov[2], None)))
-                        case 4:
-                            # gate ++ OU gate -- : prioritÃ© cÃ´tÃ© droit â†’ diagonale (1,3)
-                            edges_to_add.append((pov[1], pov[3]))
-                            orientations_to_set.append(((pov[1], pov[3]), (pov[0], pov[2])))
-                        case 5:
-                            # ++ ou -- : prioritÃ© cÃ´tÃ© droit â†’ Ã©ventail depuis 4
-                            edges_to_add.append((pov[1], pov[3]))
-                            edges_to_add.append((pov[0], pov[3]))
-                            orientations_to_set.append(((pov[1], pov[3]), (pov[0], pov[2])))
-                            orientations_to_set.append(((pov[0], pov[3]), (pov[4], pov[1])))
-                        case 6:
-                            # ++ ou -- : prioritÃ© cÃ´tÃ© droit â†’ Ã©ventail depuis 5
-                            edges_to_add.append((pov[1], pov[3]))
-                            edges_to_add.append((pov[3], pov[5]))
-                            edges_to_add.append((pov[1], pov[5]))
-                            orientations_to_set.append(((pov[1], pov[5]), (pov[0], pov[3])))
-                            orientations_to_set.append(((pov[3], pov[1]), (pov[2], pov[5])))
-                            orientations_to_set.append(((pov[5], pov[3]), (pov[4], pov[1])))
-                        case _:
-                            pass
-                case _:  # (RetriangulationTag.Minus, RetriangulationTag.Minus)
-                    match valence:
-                        case 3:
-                            orientations_to_set.append(((pov[0], pov[1]), (pov[2], None)))
-                        case 4:
-                            edges_to_add.append((pov[0], pov[2]))
-                            orientations_to_set.append(((pov[0], pov[2]), (pov[3], pov[1])))
-                        case 5:
-                            edges_to_add.append((pov[0], pov[2]))
-                            edges_to_add.append((pov[4], pov[2]))
-                            orientations_to_set.append(((pov[2], pov[0]), (pov[1], pov[4])))
-                            orientations_to_set.append(((pov[0], pov[2]), (pov[4], pov[1])))
-                        case 6:
-                            edges_to_add.append((pov[0], pov[2]))
-                            edges_to_add.append((pov[4], pov[2]))
-                            edges_to_add.append((pov[0], pov[4]))
-                            orientations_to_set.append(((pov[2], pov[0]), (pov[1], pov[4])))
-                            orientations_to_set.append(((pov[0], pov[4]), (pov[5], pov[2])))
-                            orientations_to_set.append(((pov[4], pov[2]), (pov[3], pov[0])))
-                            
-                        case _:
-                            pass
+            # Gabarits d'indices dans pov, voir _RETRIANGULATION_TABLE
+            edge_template, orientation_template = _RETRIANGULATION_TABLE.get(
+                (left_tag, right_tag), _DEFAULT_RETRIANGULATION
+            )[valence]
+            edges_to_add = [(pov[i], pov[j]) for i, j in edge_template]
+            orientations_to_set = [
+                ((pov[i], pov[j]), (pov[k], pov[l] if l is not None else None))
+                for (i, j), (k, l) in orientation_template
+            ]
 
             for edge in edges_to_add:
                 if edge[1] in mesh.active_state.vertex_connections.get(edge[0], set()):
@@ -3,7 +3,7 @@
 Public API for the frenet_local package.
 """
 
-from .vectors import normalize, any_tangent_from_normal
+from .vectors import normalize, normalize_rows, any_tangent_from_normal
 from .patch import Patch
 from .frame import FrenetFrame
 from .codec import LocalEncoder
@@ -11,6 +11,7 @@ from .quant import QuantParams, Quantizer
 
 __all__ = [
     "normalize",
+    "normalize_rows",
     "any_tangent_from_normal",
     "Patch",
     "FrenetFrame",
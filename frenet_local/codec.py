@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import Tuple
+from typing import Sequence, Tuple
 import numpy as np
 
 from .frame import FrenetFrame
@@ -15,7 +15,11 @@ class LocalEncoder:
     Methods
     -------
     encode(vr, frame) -> (alpha, beta, gamma)
+    encode_many(vr, frame) -> coords
     decode(alpha, beta, gamma, frame) -> vr_hat
+    decode_many(coords, frame) -> vr_hat
+    encode_batch(vr, frames) -> coords
+    decode_batch(coords, frames) -> vr_hat
     """
 
     @staticmethod
@@ -41,6 +45,28 @@ class LocalEncoder:
         gamma = float(np.dot(delta, frame.n))
         return alpha, beta, gamma
 
+    @staticmethod
+    def encode_many(vr: np.ndarray, frame: FrenetFrame) -> np.ndarray:
+        """
+        Project many 3D points sharing the same frame in one call.
+
+        Parameters
+        ----------
+        vr : (M, 3) float array
+            The 3D points to encode.
+        frame : FrenetFrame
+            Local frame (b, t1, t2, n).
+
+        Returns
+        -------
+        coords : (M, 3) float array
+            Rows of local coordinates (alpha, beta, gamma), row i being
+            (vr[i] - b) @ (t1, t2, n)^T.
+        """
+        vr = np.asarray(vr)
+        vr = vr.astype(np.result_type(vr.dtype, np.float32), copy=False).reshape(-1, 3)
+        return (vr - frame.b) @ frame.basis.T
+
     @staticmethod
     def decode(alpha: float, beta: float, gamma: float, frame: FrenetFrame) -> np.ndarray:
         """
@@ -59,3 +85,80 @@ class LocalEncoder:
             Reconstructed 3D point: b + alpha t1 + beta t2 + gamma n
         """
         return frame.b + alpha * frame.t1 + beta * frame.t2 + gamma * frame.n
+
+    @staticmethod
+    def decode_many(coords: np.ndarray, frame: FrenetFrame) -> np.ndarray:
+        """
+        Reconstruct many 3D points sharing the same frame in one call.
+
+        Parameters
+        ----------
+        coords : (M, 3) float array
+            Rows of local coordinates (alpha, beta, gamma).
+        frame : FrenetFrame
+            Local frame (b, t1, t2, n).
+
+        Returns
+        -------
+        vr_hat : (M, 3) float array
+            Reconstructed points, row i being b + coords[i] @ (t1, t2, n).
+        """
+        coords = np.asarray(coords)
+        coords = coords.astype(np.result_type(coords.dtype, np.float32), copy=False).reshape(-1, 3)
+        return frame.b + coords @ frame.basis
+
+    @staticmethod
+    def _stack_frames(frames: Sequence[FrenetFrame]) -> Tuple[np.ndarray, np.ndarray]:
+        origins = np.stack([f.b for f in frames])                    # (P, 3)
+        bases = np.stack([(f.t1, f.t2, f.n) for f in frames])         # (P, 3, 3)
+        return origins, bases
+
+    @staticmethod
+    def encode_batch(vr: np.ndarray, frames: Sequence[FrenetFrame]) -> np.ndarray:
+        """
+        Encode one point per frame, for many independent patches at once.
+
+        Parameters
+        ----------
+        vr : (P, 3) float array
+            Point i is encoded in frames[i] (e.g. the vertex removed from patch i).
+        frames : sequence of P FrenetFrame
+            Local frames, e.g. from FrenetFrame.from_patches_and_gates.
+
+        Returns
+        -------
+        coords : (P, 3) float array
+            Row i holds (alpha, beta, gamma) of vr[i] in frames[i].
+        """
+        vr = np.asarray(vr).reshape(-1, 3)
+        if len(vr) != len(frames):
+            raise ValueError("One point is required per frame.")
+        if len(vr) == 0:
+            return np.zeros((0, 3), dtype=np.result_type(vr.dtype, np.float32))
+        origins, bases = LocalEncoder._stack_frames(frames)
+        return np.einsum("pij,pj->pi", bases, vr - origins)
+
+    @staticmethod
+    def decode_batch(coords: np.ndarray, frames: Sequence[FrenetFrame]) -> np.ndarray:
+        """
+        Reconstruct one point per frame, inverse of `encode_batch`.
+
+        Parameters
+        ----------
+        coords : (P, 3) float array
+            Row i holds (alpha, beta, gamma) in frames[i].
+        frames : sequence of P FrenetFrame
+            Local frames (b, t1, t2, n).
+
+        Returns
+        -------
+        vr_hat : (P, 3) float array
+            Row i is b_i + coords[i] @ (t1_i, t2_i, n_i).
+        """
+        coords = np.asarray(coords).reshape(-1, 3)
+        if len(coords) != len(frames):
+            raise ValueError("One coordinate triple is required per frame.")
+        if len(coords) == 0:
+            return np.zeros((0, 3), dtype=np.result_type(coords.dtype, np.float32))
+        origins, bases = LocalEncoder._stack_frames(frames)
+        return origins + np.einsum("pj,pji->pi", coords, bases)
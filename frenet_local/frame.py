@@ -1,10 +1,10 @@
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import Tuple
+from typing import List, Sequence, Tuple
 import numpy as np
 
 from .patch import Patch
-from .vectors import normalize, any_tangent_from_normal
+from .vectors import normalize, normalize_rows, any_tangent_from_normal
 
 
 @dataclass
@@ -29,6 +29,19 @@ class FrenetFrame:
     t2: np.ndarray
     n: np.ndarray
 
+    @property
+    def basis(self) -> np.ndarray:
+        """
+        Frame axes stacked as rows.
+
+        Returns
+        -------
+        (3, 3) float array
+            Rows are (t1, t2, n), so that local coordinates (M,3) map back
+            to world offsets with ``coords @ basis``.
+        """
+        return np.stack((self.t1, self.t2, self.n))
+
     @staticmethod
     def from_patch_and_gate(
         patch: Patch,
@@ -66,8 +79,9 @@ class FrenetFrame:
         e_perp = e - np.dot(e, n) * n
         t1 = normalize(e_perp)
 
-        # Fallback if gate nearly parallel to n (projection collapses)
-        if np.linalg.norm(t1) < 1e-12:
+        # Fallback if gate nearly parallel to n (projection collapses);
+        # normalize() returns either a unit vector or exactly zero
+        if not t1.any():
             t1 = any_tangent_from_normal(n)
 
         t2 = np.cross(n, t1)
@@ -77,3 +91,82 @@ class FrenetFrame:
         t1 = normalize(np.cross(t2, n))
 
         return FrenetFrame(b=b, t1=t1, t2=t2, n=n)
+
+    @staticmethod
+    def from_patches_and_gates(
+        patches: Sequence[Patch],
+        gate_edges: Sequence[Tuple[np.ndarray, np.ndarray]],
+        project_barycenter: bool = True,
+    ) -> List["FrenetFrame"]:
+        """
+        Build the frames of many patches at once.
+
+        All patches are concatenated into flat vertex/face arrays with
+        per-patch offsets, so barycenters and area-weighted normals come out
+        of a single ``np.add.reduceat`` each, and the tangents are computed
+        row-wise. Equivalent to calling `from_patch_and_gate` per patch.
+
+        Parameters
+        ----------
+        patches : sequence of Patch
+            Local patches, each with at least one vertex and one face.
+        gate_edges : sequence of (a, c) tuples of (3,) arrays
+            Oriented gate edge of each patch.
+        project_barycenter : bool
+            If True, project each barycenter onto its tangent plane.
+
+        Returns
+        -------
+        list of FrenetFrame
+            One frame per patch, in input order.
+        """
+        if len(patches) != len(gate_edges):
+            raise ValueError("One gate edge is required per patch.")
+        if not patches:
+            return []
+        for patch in patches:
+            if patch.vertices.ndim != 2 or patch.vertices.shape[1] != 3:
+                raise ValueError("Patch.vertices must be (N,3).")
+            if patch.faces.ndim != 2 or patch.faces.shape[1] != 3:
+                raise ValueError("Patch.faces must be (M,3) of indices.")
+            if len(patch.vertices) == 0 or len(patch.faces) == 0:
+                raise ValueError("Patches must have at least one vertex and one face.")
+
+        n_verts = np.array([len(p.vertices) for p in patches])
+        n_faces = np.array([len(p.faces) for p in patches])
+        v_offs = np.concatenate(([0], np.cumsum(n_verts)[:-1]))
+        f_offs = np.concatenate(([0], np.cumsum(n_faces)[:-1]))
+
+        verts = np.concatenate([p.vertices for p in patches])
+        verts = verts.astype(np.result_type(verts.dtype, np.float32), copy=False)
+        # Local face indices shifted into the flat vertex array
+        faces = np.concatenate([p.faces for p in patches]) + np.repeat(v_offs, n_faces)[:, None]
+
+        # Area-weighted normals: one cross product per face, summed per patch
+        tri = verts[faces]
+        p0, q, r = tri[:, 0], tri[:, 1], tri[:, 2]
+        n = normalize_rows(np.add.reduceat(np.cross(q - p0, r - p0), f_offs, axis=0))
+
+        # Counts cast to the vertex dtype so float32 patches keep a float32 origin
+        b = np.add.reduceat(verts, v_offs, axis=0) / n_verts[:, None].astype(verts.dtype)
+        if project_barycenter:
+            ref = verts[v_offs]
+            dist = np.einsum("ij,ij->i", b - ref, n)
+            b = b - dist[:, None] * n
+
+        a = np.array([g[0] for g in gate_edges], dtype=verts.dtype)
+        c = np.array([g[1] for g in gate_edges], dtype=verts.dtype)
+        e = c - a
+        # Project gates onto the tangent planes: e_perp = e - (e·n) n
+        e_perp = e - np.einsum("ij,ij->i", e, n)[:, None] * n
+        t1 = normalize_rows(e_perp)
+
+        # Fallback where the gate is nearly parallel to n (projection collapses)
+        for i in np.flatnonzero(np.linalg.norm(t1, axis=1) < 1e-12):
+            t1[i] = any_tangent_from_normal(n[i])
+
+        t2 = normalize_rows(np.cross(n, t1))
+        # Re-orthogonalize t1 just in case (numerical safety)
+        t1 = normalize_rows(np.cross(t2, n))
+
+        return [FrenetFrame(b=b[i], t1=t1[i], t2=t2[i], n=n[i]) for i in range(len(patches))]
@@ -1,5 +1,6 @@
 from __future__ import annotations
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Optional
 import numpy as np
 
 from .vectors import normalize
@@ -24,9 +25,43 @@ class Patch:
     faces = np.array([
         [0, 1, 2],
     ])
+
+    The normal and the raw barycenter do not depend on the gate; they are
+    computed on first use and cached, so several frames built on the same
+    patch do not recompute them. Reassigning `vertices` or `faces` drops the
+    cache; modifying them in place is not detected and must be avoided once
+    the patch is in use.
     """
     vertices: np.ndarray  # shape (N, 3)
     faces: np.ndarray     # shape (M, 3), dtype=int
+    _normal: Optional[np.ndarray] = field(default=None, init=False, repr=False, compare=False)
+    _mean: Optional[np.ndarray] = field(default=None, init=False, repr=False, compare=False)
+
+    def __setattr__(self, name, value):
+        # New geometry: the cached normal / barycenter no longer apply
+        if name in ("vertices", "faces"):
+            object.__setattr__(self, "_normal", None)
+            object.__setattr__(self, "_mean", None)
+        object.__setattr__(self, name, value)
+
+    def _cached_normal(self) -> np.ndarray:
+        if self._normal is None:
+            tri = self.vertices[self.faces]  # (M, 3, 3)
+            p, q, r = tri[:, 0], tri[:, 1], tri[:, 2]
+            n_f = np.cross(q - p, r - p)  # magnitude = 2 * area, one row per face
+            # float32 patches stay float32; integer vertices are promoted to float64
+            acc = n_f.sum(axis=0, dtype=np.result_type(n_f.dtype, np.float32))
+            n = normalize(acc)
+            n.setflags(write=False)
+            self._normal = n
+        return self._normal
+
+    def _cached_mean(self) -> np.ndarray:
+        if self._mean is None:
+            mean = np.mean(self.vertices, axis=0)
+            mean.setflags(write=False)
+            self._mean = mean
+        return self._mean
 
     def area_weighted_normal(self) -> np.ndarray:
         """
@@ -35,14 +70,10 @@ class Patch:
         Returns
         -------
         n : (3,) float array
-            Unit-length area-weighted average normal.
+            Unit-length area-weighted average normal (a fresh copy of the
+            cached value, safe to modify).
         """
-        acc = np.zeros(3, dtype=float)
-        for f in self.faces:
-            p, q, r = self.vertices[f[0]], self.vertices[f[1]], self.vertices[f[2]]
-            n_f = np.cross(q - p, r - p)  # magnitude = 2 * area
-            acc += n_f
-        return normalize(acc)
+        return self._cached_normal().copy()
 
     def barycenter(self, project_to_plane: bool = False) -> np.ndarray:
         """
@@ -59,11 +90,11 @@ class Patch:
         b : (3,) float array
             Barycenter (possibly projected) used as the origin of the local frame.
         """
-        b_raw = np.mean(self.vertices, axis=0)
+        b_raw = self._cached_mean()
         if not project_to_plane:
-            return b_raw
+            return b_raw.copy()
 
-        n = self.area_weighted_normal()
+        n = self._cached_normal()
         ref = self.vertices[0]
         dist = np.dot((b_raw - ref), n)
         b_proj = b_raw - dist * n
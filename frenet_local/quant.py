@@ -57,8 +57,8 @@ class Quantizer:
         if bits < 2:
             raise ValueError("bits must be >= 2")
 
-        vmax = float(max(abs(min(values, default=0.0)),
-                         abs(max(values, default=0.0))))
+        v = np.asarray(values, dtype=float)
+        vmax = float(np.abs(v).max()) if v.size else 0.0
         qmax = (2 ** (bits - 1)) - 1
         scale = (qmax / vmax) if vmax > 1e-12 else 1.0
         return QuantParams(offset=0.0, scale=scale, bits=bits)
@@ -68,7 +68,14 @@ class Quantizer:
         """
         Quantize floats -> int32 using params (offset, scale).
         """
-        return np.round((np.asarray(values, dtype=float) - params.offset) * params.scale).astype(np.int32)
+        # np.array copie toujours (meme pour un scalaire) : les operations en place
+        # portent sur un tableau qui nous appartient
+        q = np.array(values, dtype=np.float64)
+        q -= params.offset
+        q *= params.scale
+        np.rint(q, out=q)
+        # [()] rend un scalaire np.int32 pour une entree scalaire, le tableau sinon
+        return q.astype(np.int32)[()]
 
     @staticmethod
     def dequantize(qvalues: Sequence[int], params: QuantParams) -> np.ndarray:
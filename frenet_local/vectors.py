@@ -1,4 +1,6 @@
 from __future__ import annotations
+import math
+
 import numpy as np
 
 
@@ -18,12 +20,35 @@ def normalize(v: np.ndarray, eps: float = 1e-12) -> np.ndarray:
     np.ndarray
         Unit vector with same shape as v.
     """
-    n = np.linalg.norm(v)
+    # sqrt(<v, v>) directly: np.linalg.norm pays a lot of dispatch overhead
+    # for the tiny vectors used here (same value, it reduces to this as well)
+    n = math.sqrt(np.vdot(v, v))
     if n < eps:
         return v * 0.0
     return v / n
 
 
+def normalize_rows(v: np.ndarray, eps: float = 1e-12) -> np.ndarray:
+    """
+    Row-wise version of `normalize`: rows with norm < eps become zero.
+
+    Parameters
+    ----------
+    v : (M, 3) np.ndarray
+        Input vectors, one per row.
+    eps : float
+        Small epsilon to guard against division by zero.
+
+    Returns
+    -------
+    (M, 3) np.ndarray
+        Unit rows (or zero rows where the input norm is below eps).
+    """
+    n = np.linalg.norm(v, axis=1, keepdims=True)
+    out = np.zeros_like(v, dtype=np.result_type(v.dtype, np.float32))
+    return np.divide(v, n, out=out, where=n >= eps)
+
+
 def any_tangent_from_normal(n: np.ndarray) -> np.ndarray:
     """
     Build a stable tangent lying in the plane orthogonal to n.
@@ -40,8 +65,9 @@ def any_tangent_from_normal(n: np.ndarray) -> np.ndarray:
     (3,) np.ndarray
         Unit tangent vector orthogonal to n.
     """
-    aux = np.array([1.0, 0.0, 0.0], dtype=float)
+    dtype = np.result_type(n.dtype, np.float32)
+    aux = np.array([1.0, 0.0, 0.0], dtype=dtype)
     if abs(np.dot(aux, n)) > 0.9:
-        aux = np.array([0.0, 1.0, 0.0], dtype=float)
+        aux = np.array([0.0, 1.0, 0.0], dtype=dtype)
     t = np.cross(n, aux)
     return normalize(t)
@@ -1,6 +1,8 @@
 import math
 from typing import List, Tuple
 
+import numpy as np
+
 Vertex = Tuple[int, int, int]
 Face = List[int]
 
@@ -112,11 +114,10 @@ def generate_three_layer_sphere_int(n: int,
 
 
 def write_obj_file(filename: str, vertices: List[Vertex], faces: List[Face]) -> None:
+    # Formatage en bloc : une seule passe savetxt par section au lieu d'un write par ligne
     with open(filename, "w") as f:
-        for v in vertices:
-            f.write(f"v {v[0]} {v[1]} {v[2]}\n")
-        for face in faces:
-            f.write("f " + " ".join(str(i + 1) for i in face) + "\n")
+        np.savetxt(f, np.asarray(vertices, dtype=np.int64).reshape(-1, 3), fmt="v %d %d %d")
+        np.savetxt(f, np.asarray(faces, dtype=np.int64).reshape(-1, 3) + 1, fmt="f %d %d %d")
     print(f"Written:", filename)
 
 
@@ -1,11 +1,10 @@
-import numpy as np
 from PCLTTM import PCLTTM
-import copy
+from PCLTTM.debug import enable_debug_checks
 def main():
     """
     Runs the program on the model given as parameter.
     """
-    np.seterr(invalid='raise')
+    enable_debug_checks()
     
     model = PCLTTM()
     model.parse_file('example/icosphere.obj')
@@ -13,7 +12,7 @@ def main():
     num_vertex = len(model.mesh.get_vertices()) if model.mesh is not None else 0
     iteration_compress = 0
 
-    model_iter = copy.deepcopy(model)
+    model_iter = model.snapshot()
     initial_gate = model_iter.mesh.get_random_gate()
     new_num_vertex = -1
     while  new_num_vertex != num_vertex :
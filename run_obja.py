@@ -1,44 +1,43 @@
-import numpy as np
 from PCLTTM import PCLTTM
-import copy
+from PCLTTM.debug import enable_debug_checks
 
 # >>> AJOUTS IMPORTS POUR L'OBJA
 from collections import deque
+from operator import attrgetter
 from typing import Dict, List, Tuple
-from PCLTTM.data_structures.face import Face
 from PCLTTM.data_structures.vertex import Vertex
 
+# Ecrit compression_step_<i>.obj a chaque iteration (debug uniquement)
+EXPORT_STEPS = False
+# Affiche le detail face par face de la generation de l'OBJA (debug uniquement)
+VERBOSE = False
 
-# On definit une cle par face qui ne change pas si l'orientaion change
-def face_key(face: Face) -> Tuple[Vertex, Vertex, Vertex]:
-    return tuple(sorted(face.vertices, key=id))
+
+def vertex_line(v: Vertex) -> str:
+    # Un seul acces a position ; le format reste repr() pour ne rien perdre
+    x, y, z = v.position
+    return f"v {x} {y} {z}\n"
 
 
 def print_initial_model(mesh, output_file):
     # Collect vertices
-    vertices = sorted(mesh.get_vertices())
+    vertices = sorted(mesh.get_vertices(), key=attrgetter("position"))
     vertices_indices: Dict[Vertex, int] = {v: i + 1 for i, v in enumerate(vertices)}
     faces_indices: Dict[Tuple[Vertex, Vertex, Vertex], int] = {}
 
-    # ---- write vertices ----
-    for v in vertices:
-        x, y, z = v.position
-        output_file.write(f"v {x} {y} {z}\n")
-
-    # ---- collect unique faces preserving orientation ----
-    # Use a mapping from frozenset(vertices) -> oriented tuple(vertices)
-    # so we deduplicate faces while keeping the original vertex order
+    # ---- vertices ----
+    lines = [vertex_line(v) for v in vertices]
 
-    for v in vertices:
-        for face in mesh.get_faces(v):
-            if face is None or face in faces_indices:
-                print("Face to add already exists, skipping:", face)
-                continue
+    # ---- faces ----
+    # get_all_faces() renvoie chaque face une seule fois, avec son orientation
+    for face in mesh.get_all_faces():
+        lines.append(
+            "f " + " ".join(str(vertices_indices[vtx]) for vtx in face.vertices) + "\n"
+        )
+        faces_indices[face] = len(faces_indices) + 1
 
-            output_file.write(
-                "f " + " ".join(str(vertices_indices[vtx]) for vtx in face.vertices) + "\n"
-            )
-            faces_indices[face] = len(faces_indices) + 1
+    # Une seule ecriture pour tout le modele initial
+    output_file.write("".join(lines))
 
     return vertices_indices, faces_indices
 
@@ -47,7 +46,7 @@ def main():
     """
     Runs the program on the model given as parameter.
     """
-    np.seterr(invalid='raise')
+    enable_debug_checks()
     
     model = PCLTTM()
     model.parse_file('example/test_complete.obj')
@@ -55,28 +54,29 @@ def main():
     num_vertex = len(model.mesh.get_vertices()) if model.mesh is not None else 0
     iteration_compress = 0
 
-    model_iter = copy.deepcopy(model)
+    model_iter = model.snapshot()
     initial_gate = model_iter.mesh.get_random_gate()
     new_num_vertex = -1
 
     # Pour stocker les états successifs en mémoire
-    steps = [copy.deepcopy(model_iter)]  # liste de PCLTTM après chaque compress()
+    steps = [model_iter.snapshot()]  # liste de PCLTTM après chaque compress()
 
     while new_num_vertex != num_vertex:
         
         iteration_compress += 1
         model_iter.compress(iteration_compress, initial_gate)
-        model_iter.mesh.export_to_obj(f"compression_step_{iteration_compress}.obj")
+        if EXPORT_STEPS:
+            model_iter.mesh.export_to_obj(f"compression_step_{iteration_compress}.obj")
 
         # état courant en mémoire
-        steps.append(copy.deepcopy(model_iter))
+        steps.append(model_iter.snapshot())
 
         num_vertex = new_num_vertex
         new_num_vertex = len(model_iter.mesh.get_vertices())
         if new_num_vertex == 4:
             break
-        model_iter = PCLTTM()
-        model_iter.parse_file(f'compression_step_{iteration_compress}.obj')
+        # On garde le modele en memoire : seuls les etats par sommet sont reinitialises
+        model_iter.reset_states()
         initial_gate = model_iter.mesh.get_random_gate()
         print(f"After iteration {iteration_compress}, number of vertices: {new_num_vertex}, old: {num_vertex}")
     
@@ -102,46 +102,53 @@ def main():
             vertex_diffs = compression_diffs[0]
             face_to_delete = compression_diffs[1]
 
+            # Lignes de l'etape mises en tampon, ecrites en une fois a la fin de l'etape
+            buf: List[str] = []
+
             previously_deleted_faces = set()
             for face in face_to_delete:  # edges to remove
                 if face not in previously_deleted_faces and face in face_idx:
                     face_index = face_idx[face]
-                    output_file.write(f"df {face_index}\n")
-                    print("Deleted left face:", face)
+                    buf.append(f"df {face_index}\n")
+                    if VERBOSE:
+                        print("Deleted left face:", face)
                     previously_deleted_faces.add(face)
-                elif face in previously_deleted_faces:
-                    print("Left face already deleted:", face)
-                else:
-                    print("Left face to delete not found:", face)
+                elif VERBOSE:
+                    if face in previously_deleted_faces:
+                        print("Left face already deleted:", face)
+                    else:
+                        print("Left face to delete not found:", face)
 
-            vertex_to_add = sorted(vertex_diffs.keys())
+            vertex_to_add = sorted(vertex_diffs.keys(), key=attrgetter("position"))
             for v in vertex_to_add:
                 if v not in vertex_idx:
-                    output_file.write(
-                        f"v {v.position[0]} {v.position[1]} {v.position[2]}\n")
+                    buf.append(vertex_line(v))
                     vertex_idx[v] = len(vertex_idx) + 1
 
                 patch = steps[i - 1].mesh.get_patch(v)
                 for f in patch.faces:
                     if f in face_idx:
-                        print("Face to add already exists, skipping:", f)
+                        if VERBOSE:
+                            print("Face to add already exists, skipping:", f)
                         continue  # face already exists
                     elif f in previously_deleted_faces:
-                        print("Adding a deleted face")
+                        if VERBOSE:
+                            print("Adding a deleted face")
                         previously_deleted_faces.remove(f)
-                    else:
+                    elif VERBOSE:
                         print("Adding face:", f)
                     
                     vertices_in_face = []
                     for v_face in f.vertices:
                         if v_face not in vertex_idx:
-                            output_file.write(f"v {v_face.position[0]} {v_face.position[1]} {v_face.position[2]}\n")
+                            buf.append(vertex_line(v_face))
                             vertex_idx[v_face] = len(vertex_idx) + 1
                         vertices_in_face.append(str(vertex_idx[v_face]))
                     
-                    output_file.write("f " + " ".join(vertices_in_face) + "\n")
+                    buf.append("f " + " ".join(vertices_in_face) + "\n")
                     face_idx[f] = len(face_idx) + 1
-                        
+
+            output_file.write("".join(buf))
 
     print("Done.")
 
@@ -1,14 +1,15 @@
 from collections import deque
 from copy import deepcopy
+from operator import attrgetter
 from typing import Dict
-import numpy as np
 from PCLTTM import PCLTTM
+from PCLTTM.debug import enable_debug_checks
 from PCLTTM.data_structures.face import Face
 from PCLTTM.data_structures.vertex import Vertex
 
 def print_initial_model(steps, output_file):
     # Collect vertices
-    vertices = sorted(steps.get_vertices())
+    vertices = sorted(steps.get_vertices(), key=attrgetter("position"))
     vertices_indices = {v: i + 1 for i, v in enumerate(vertices)}
     faces_indices = {}
     # ---- write vertices ----
@@ -34,7 +35,7 @@ def main():
     """
     Runs the program on the model given as parameter.
     """
-    np.seterr(invalid='raise')
+    enable_debug_checks()
     model = PCLTTM()
     model.parse_file('example/crude_sphere_6.obj')
 
@@ -64,7 +65,7 @@ def main():
             for face in face_to_remove:
                 available_face_to_update.append(face)
 
-            vertex_to_add = sorted(compression_diffs[0].keys())
+            vertex_to_add = sorted(compression_diffs[0].keys(), key=attrgetter("position"))
             for v in vertex_to_add: # vertices to update
                 if v not in vertex_idx:
                     output_file.write(f"v {v.position[0]} {v.position[1]} {v.position[2]}\n")
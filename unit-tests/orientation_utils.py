@@ -0,0 +1,21 @@
+"""
+Outils partages par les tests de retriangulation.
+"""
+from typing import List
+
+import numpy as np
+
+from PCLTTM.data_structures.face import Face
+
+
+def faces_oriented_correctly(faces: List[Face]) -> np.ndarray:
+    """
+    Masque booleen : True pour chaque face dont la normale pointe vers +z.
+    Toutes les faces sont traitees en une fois sur un tableau (F, 3, 3).
+    """
+    pos = np.array([[v.position for v in face.vertices] for face in faces],
+                   dtype=np.float64).reshape(-1, 3, 3)
+    u = pos[:, 1] - pos[:, 0]
+    v = pos[:, 2] - pos[:, 0]
+    # Le patch est dans le plan z = 0 : seule la composante z de la normale compte
+    return u[:, 0] * v[:, 1] - u[:, 1] * v[:, 0] > 0
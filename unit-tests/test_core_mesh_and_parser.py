@@ -1,12 +1,50 @@
-from typing import List
+from collections import defaultdict
+from itertools import combinations
+from typing import List, Tuple
+import io
+import logging
+import os
 import random
 
+import numpy as np
+import pytest
+
 from PCLTTM import PCLTTM
 from PCLTTM.data_structures.face import Face
 from PCLTTM.data_structures.vertex import Vertex
+from PCLTTM.mesh import MeshTopology
+from PCLTTM.obja_parser import FACE_INDEX_RE, ObjaReader
 
 OBJ_FILE = "example/crude_sphere_12.obj"
 
+# Traces de debug (pytest --log-level=DEBUG) : les repr ne sont calcules que si active
+log = logging.getLogger(__name__)
+
+
+def _load_obj_np(path: str) -> Tuple[np.ndarray, List[np.ndarray]]:
+    """
+    Lecture en bloc d'un .obj : sommets en tableau (N, 3) et, pour chaque face,
+    un tableau de ses indices de sommets (base 0).
+    """
+    with open(path, "rb") as f:
+        lines = f.read().splitlines()
+
+    v_lines = [line[2:] for line in lines if line[:2] == b"v "]
+    f_lines = [line[2:] for line in lines if line[:2] == b"f "]
+
+    vertices = np.loadtxt(io.BytesIO(b"\n".join(v_lines)), dtype=np.float64,
+                          usecols=(0, 1, 2), ndmin=2)
+    faces = [np.array(FACE_INDEX_RE.findall(line), dtype=np.int32) - 1 for line in f_lines]
+    return vertices, faces
+
+
+def _obj_vertices(positions: np.ndarray) -> List[Vertex]:
+    """
+    Un seul Vertex par sommet du .obj : les faces qui le referencent partagent
+    le meme objet (pas de nouvelle allocation ni de nouveau hash par reference).
+    """
+    return [Vertex(tuple(pos)) for pos in positions.tolist()]
+
 
 # ---------------------------------------------------------------------------
 # Tests de base : Vertex / Face / hashing / sets
@@ -76,53 +114,42 @@ def test_face_in_set():
 # Tests parser + mesh : connexions and orientations
 # ---------------------------------------------------------------------------
 
-def test_sampled_orientation():
+@pytest.fixture(scope="module")
+def crude_sphere_model():
+    """
+    Modele parse et contenu brut du .obj, charges une seule fois pour le module.
+    Les tests qui l'utilisent ne doivent pas modifier le modele.
+    """
+    model = PCLTTM()
+    model.parse_file(OBJ_FILE)
+    positions, faces = _load_obj_np(OBJ_FILE)
+    return model, _obj_vertices(positions), faces
+
+
+def test_sampled_orientation(crude_sphere_model):
     """
     Vérifie que pour un sous-ensemble de faces de l'OBJ, l’orientation
     stockée dans model.mesh correspond bien à l'ordre des sommets dans le .obj.
     """
-    obj_file = OBJ_FILE
     sample_size = 200
 
-    # 1. Load model
-    model = PCLTTM()
-    model.parse_file(obj_file)
-
-    # 2. Read OBJ vertices & faces
-    vertices: List[tuple[float, float, float]] = []
-    faces: List[list[int]] = []
-
-    with open(obj_file, "r") as f:
-        for line in f:
-            if line.startswith("v "):
-                parts = line.split()
-                x, y, z = map(float, parts[1:4])
-                vertices.append((x, y, z))
-            elif line.startswith("f "):
-                parts = line.split()[1:]
-                # gestion simple du format "i" ou "i/..."
-                face_indices = [int(p.split("/")[0]) for p in parts]
-                faces.append(face_indices)
+    # 1. Load model, OBJ vertices & faces
+    model, vertices, faces = crude_sphere_model
 
     assert len(vertices) > 0
     assert len(faces) > 0
 
     # 3. Sample some faces
     sample_count = min(sample_size, len(faces))  
-    print(f"Sampling {sample_count} faces out of {len(faces)} total faces.")
-    sampled_faces = random.sample(faces, sample_count)
-    sampled_structured_faces: List[Face] = []
-
-    for face in sampled_faces:
-        face_vertices = []
-        for idx in face:
-            x, y, z = vertices[idx - 1]  # OBJ indices start at 1
-            vertex_obj = Vertex((x, y, z))
-            face_vertices.append(vertex_obj)
-        sampled_structured_faces.append(Face(tuple(face_vertices)))
+    log.debug("Sampling %d faces out of %d total faces.", sample_count, len(faces))
+    if sample_count >= len(faces):
+        sampled_faces = faces  # tout l'echantillon : pas de copie ni de tirage
+    else:
+        sampled_faces = random.sample(faces, sample_count)
 
     # 4. Check orientation per face
-    for face in sampled_structured_faces:
+    for face_indices in sampled_faces:
+        face = Face(tuple(vertices[idx] for idx in face_indices.tolist()))
         n = len(face.vertices)
         for i in range(n):
             v_from = face.vertices[i]
@@ -139,46 +166,209 @@ def test_sampled_orientation():
             )
 
 
-def test_vertices_connections():
+def test_vertices_connections(crude_sphere_model):
     """
     Vérifie que les connexions dans le mesh reconstruit correspondent
     aux adjacences des faces du .obj.
     """
-    obj_file = OBJ_FILE
+    model, vertices, faces = crude_sphere_model
+    # Adjacence attendue sur les indices du .obj (hash d'entiers), les Vertex
+    # ne sont utilises que pour la comparaison avec le mesh
+    expected_conns_map: defaultdict[int, set[int]] = defaultdict(set)
+
+    # Chaque paire de sommets d'une face est une arete : une seule visite par paire
+    for face in faces:
+        for a, b in combinations(face.tolist(), 2):
+            expected_conns_map[a].add(b)
+            expected_conns_map[b].add(a)
+
+    # Test direct contre la vue des cles : seuls les sommets manquants sont inseres
+    mesh_keys = model.mesh.active_state.vertex_connections.keys()
+    difference_found = {v for v in vertices if v not in mesh_keys}
+    assert difference_found == set(), f"Vertices missing in mesh connections: {difference_found}"
+
+    # Verify connections : test d'inclusion (arret au premier manquant),
+    # la difference n'est calculee que pour le message d'erreur
+    vertex_connections = model.mesh.active_state.vertex_connections
+    for v_idx, expected_idx in expected_conns_map.items():
+        vertex = vertices[v_idx]
+        expected_conns = {vertices[idx] for idx in expected_idx}
+        model_conns = vertex_connections.get(vertex)
+        if model_conns is None or not expected_conns <= model_conns:
+            missing = expected_conns - (model_conns or set())
+            pytest.fail(f"Missing connections for vertex {vertex}: {missing}")
+
+
+# ---------------------------------------------------------------------------
+# Construction de l'adjacence : identique aux appels add_edge / set_orientation
+# ---------------------------------------------------------------------------
+
+# Arete (1, 2) partagee par trois faces (non manifold) et face 2 3 6
+# orientee a l'envers de sa voisine 1 2 3
+NON_MANIFOLD_OBJ = """\
+v 0.0 0.0 0.0
+v 1.0 0.0 0.0
+v 0.0 1.0 0.0
+v 0.0 -1.0 0.0
+v 0.0 0.0 1.0
+v 1.0 1.0 0.0
+f 1 2 3
+f 2 1 4
+f 1 2 5
+f 2 3 6
+"""
+
+
+def _sequential_topology(vertices: List[Vertex], faces: List[Face]) -> MeshTopology:
+    """
+    Reference : une arete apres l'autre, dans l'ordre des faces.
+    """
+    mesh = MeshTopology()
+    for v in vertices:
+        mesh.add_vertex(v)
+    for face in faces:
+        for edge in face.edges():
+            mesh.add_edge(*edge)
+            mesh.set_orientation(edge, (face.next_vertex(edge), None))
+    return mesh
+
+
+def _batched_topology(vertices: List[Vertex], faces: List[Face]) -> MeshTopology:
+    mesh = MeshTopology()
+    for v in vertices:
+        mesh.add_vertex(v)
+    mesh._build_adjacency(faces)
+    return mesh
+
+
+def _assert_same_topology(mesh: MeshTopology, expected: MeshTopology) -> None:
+    # Comparaison en liste : l'ordre d'insertion des dicts fait partie du resultat
+    got, ref = mesh.active_state, expected.active_state
+    assert list(got.vertex_connections) == list(ref.vertex_connections)
+    for v, neighbors in ref.vertex_connections.items():
+        assert list(got.vertex_connections[v]) == list(neighbors)
+    assert list(got.orientations.items()) == list(ref.orientations.items())
+
+
+@pytest.mark.parametrize("obj_file", [OBJ_FILE, "example/suzanne.obj", "non_manifold"])
+def test_adjacency_matches_sequential_build(obj_file, tmp_path):
+    if obj_file == "non_manifold":
+        obj_file = tmp_path / "non_manifold.obj"
+        obj_file.write_text(NON_MANIFOLD_OBJ)
+
+    elems = list(ObjaReader().parse_file(str(obj_file)))
+    vertices = [e for e in elems if isinstance(e, Vertex)]
+    faces = [e for e in elems if isinstance(e, Face)]
+
+    expected = _sequential_topology(vertices, faces)
+    _assert_same_topology(MeshTopology.from_obj_file(str(obj_file)), expected)
+
+
+def test_adjacency_non_manifold_edge():
+    v1, v2, v3, v4, v5, v6 = (Vertex(p) for p in [
+        (0.0, 0.0, 0.0), (1.0, 0.0, 0.0), (0.0, 1.0, 0.0),
+        (0.0, -1.0, 0.0), (0.0, 0.0, 1.0), (1.0, 1.0, 0.0),
+    ])
+    faces = [Face(f) for f in [(v1, v2, v3), (v2, v1, v4), (v1, v2, v5), (v2, v3, v6)]]
+    mesh = _batched_topology([v1, v2, v3, v4, v5, v6], faces)
+
+    # Une demi-arete partagee garde la derniere face ecrite, l'ancienne est perdue :
+    # (1, 2) passe de la face 1 2 3 a la face 1 2 5, la face 2 1 4 reste a droite
+    assert mesh.get_oriented_vertices((v1, v2)) == (v5, v4)
+    assert mesh.get_oriented_vertices((v2, v1)) == (v4, v5)
+    # Face 2 3 6 orientee comme 1 2 3 sur (2, 3) : elle la remplace, sans face a droite
+    assert mesh.get_oriented_vertices((v2, v3)) == (v6, None)
+    assert mesh.get_oriented_vertices((v3, v2)) == (None, v6)
+
+
+def test_adjacency_faces_with_unknown_vertices():
+    v1, v2, v3, outside = (Vertex(p) for p in [
+        (0.0, 0.0, 0.0), (1.0, 0.0, 0.0), (0.0, 1.0, 0.0), (5.0, 5.0, 5.0),
+    ])
+    faces = [Face((v1, v2, v3)), Face((v2, v1, outside))]
+
+    # Pas de KeyError : comme add_edge / set_orientation, les aretes vers un
+    # sommet absent du mesh sont ignorees
+    mesh = _batched_topology([v1, v2, v3], faces)
+    assert outside not in mesh.active_state.vertex_connections
+    _assert_same_topology(mesh, _sequential_topology([v1, v2, v3], faces))
 
+
+# ---------------------------------------------------------------------------
+# Difference entre deux etats
+# ---------------------------------------------------------------------------
+
+def test_compression_difference_removed_edge_faces_listed_once():
+    a, b, c, d = (Vertex(p) for p in [
+        (0.0, 0.0, 0.0), (1.0, 0.0, 0.0), (0.0, 1.0, 0.0), (0.0, -1.0, 0.0),
+    ])
+    current = MeshTopology.State()
+    current.orientations[(a, b)] = (c, d)
+    current.orientations[(b, a)] = (d, c)
+
+    _, faces_to_remove = current.compression_difference(MeshTopology.State())
+
+    # L'arete (a, b) et son opposee portent les deux memes faces : une seule fois chacune
+    assert len(faces_to_remove) == 2
+    assert set(faces_to_remove) == {Face((a, b, c)), Face((a, b, d))}
+
+
+# ---------------------------------------------------------------------------
+# Snapshot : copie independante du modele
+# ---------------------------------------------------------------------------
+
+def test_snapshot_independent_of_compression(tmp_path, monkeypatch):
+    obj_path = os.path.abspath("./example/test_complete.obj")
+    # compress() exporte decimation.obj dans le repertoire courant
+    monkeypatch.chdir(tmp_path)
+
+    random.seed(0)
     model = PCLTTM()
-    model.parse_file(obj_file)
-
-    vertices: List[Vertex] = []
-    connexions: dict[Vertex, set[Vertex]] = {}
-
-    with open(obj_file, "r") as f:
-        for line in f:
-            if line.startswith("v "):
-                parts = line.split()
-                x, y, z = map(float, parts[1:4])
-                vertices.append(Vertex((x, y, z)))
-            elif line.startswith("f "):
-                parts = line.split()[1:]
-                face_indices = [int(p.split("/")[0]) for p in parts]
-                for v_idx in face_indices:
-                    vertex = vertices[v_idx - 1]
-                    if vertex not in connexions:
-                        connexions[vertex] = set()
-                    for other_idx in face_indices:
-                        if other_idx != v_idx:
-                            connexions[vertex].add(vertices[other_idx - 1])
-
-    difference_found = set(vertices).difference(
-        model.mesh.active_state.vertex_connections.keys()
-    )
-    assert difference_found == set(), f"Vertices missing in mesh connections: {difference_found}"
+    model.parse_file(obj_path)
+
+    vertices_before = set(model.mesh.get_vertices())
+    orientations_before = dict(model.mesh.active_state.orientations)
+
+    snapshot = model.snapshot()
+    model.compress(1, model.mesh.get_random_gate())
+
+    # La compression a bien modifie l'original...
+    assert len(model.mesh.get_vertices()) < len(vertices_before)
+
+    # ... mais pas la copie
+    assert set(snapshot.mesh.get_vertices()) == vertices_before
+    assert snapshot.mesh.active_state.orientations == orientations_before
+    assert snapshot.state_flags is not model.state_flags
+    assert snapshot.retriangulator.retriangulation_tags is not model.retriangulator.retriangulation_tags
+
+    # Les sommets de la copie sont rattaches a la copie, sans historique de commits
+    assert all(v.mesh is snapshot.mesh for v in snapshot.mesh.get_vertices())
+    assert all(v.mesh is snapshot.mesh for v in snapshot.state_flags)
+    assert all(v.mesh is snapshot.mesh for v in snapshot.retriangulator.retriangulation_tags)
+    assert len(snapshot.mesh.committed_states) == 1
+
+
+def test_reset_states_after_compression(tmp_path, monkeypatch):
+    from PCLTTM.data_structures.constants import StateFlag, RetriangulationTag
+
+    # Sans mesh charge : rien a reinitialiser
+    PCLTTM().reset_states()
+
+    obj_path = os.path.abspath("./example/test_complete.obj")
+    monkeypatch.chdir(tmp_path)
+
+    random.seed(0)
+    model = PCLTTM()
+    model.parse_file(obj_path)
+    model.compress(1, model.mesh.get_random_gate())
+    model.reset_states()
 
-    # Verify connections
-    for vertex, expected_conns in connexions.items():
-        model_conns = model.mesh.active_state.vertex_connections.get(vertex, set())
-        difference = expected_conns.difference(model_conns)
-        assert difference == set(), f"Missing connections for vertex {vertex}: {difference}"
+    # Historique de commits abandonne, tous les sommets restants libres
+    vertices = model.mesh.get_vertices()
+    assert len(model.mesh.committed_states) == 1
+    assert not model.mesh.rollback()
+    assert model.state_flags == dict.fromkeys(vertices, StateFlag.Free)
+    assert model.retriangulator.retriangulation_tags == dict.fromkeys(vertices, RetriangulationTag.Default)
 
 
 # ---------------------------------------------------------------------------
@@ -208,9 +398,9 @@ def test_retriangulation():
     # valence is taken from the mesh topology
     valence = center_vertex.valence()
 
-    print(
-        valence, "valence", center_vertex,
-        "state:", vertex_state, left_vertex, right_vertex
+    log.debug(
+        "%s valence %s state: %s %s %s",
+        valence, center_vertex, vertex_state, left_vertex, right_vertex
     )
 
     can_remove = model.mesh.can_remove_vertex(center_vertex)
@@ -221,7 +411,7 @@ def test_retriangulation():
     assert patch is not None and patch.valence() > 0, "Patch should not be null or empty in this test."
 
     out_gates = patch.output_gates(initial_gate.edge)
-    print(len(out_gates), "gates in the patch")
+    log.debug("%d gates in the patch", len(out_gates))
 
     patch_vertices = patch.surrounding_vertices(initial_gate.edge)
 
@@ -0,0 +1,192 @@
+import numpy as np
+import pytest
+
+from frenet_local import FrenetFrame, LocalEncoder, Patch, Quantizer, normalize_rows
+
+
+# Carre unite en deux triangles dans le plan z = 0 (normale +z)
+FAN_VERTICES = np.array([
+    [0.0, 0.0, 0.0],
+    [1.0, 0.0, 0.0],
+    [1.0, 1.0, 0.0],
+    [0.0, 1.0, 0.0],
+])
+FAN_FACES = np.array([[0, 1, 2], [0, 2, 3]])
+
+
+def _random_fans(sizes, seed=0):
+    """
+    Patchs en eventail (sommet 0 au centre) de tailles differentes, avec
+    l'arete (1, 2) comme gate.
+    """
+    rng = np.random.default_rng(seed)
+    patches, gates = [], []
+    for size in sizes:
+        vertices = rng.normal(size=(size, 3))
+        faces = np.array([[0, i, i + 1] for i in range(1, size - 1)])
+        patches.append(Patch(vertices, faces))
+        gates.append((vertices[1], vertices[2]))
+    return patches, gates
+
+
+# ---------------------------------------------------------------------------
+# Patch : cache de la normale et du barycentre
+# ---------------------------------------------------------------------------
+
+def test_patch_cache_dropped_on_reassignment():
+    patch = Patch(FAN_VERTICES.copy(), FAN_FACES)
+    np.testing.assert_allclose(patch.area_weighted_normal(), [0.0, 0.0, 1.0])
+    np.testing.assert_allclose(patch.barycenter(), [0.5, 0.5, 0.0])
+
+    # Meme patch bascule dans le plan x = 0 : normale et barycentre recalcules
+    patch.vertices = FAN_VERTICES[:, [2, 0, 1]]
+    np.testing.assert_allclose(patch.area_weighted_normal(), [1.0, 0.0, 0.0])
+    np.testing.assert_allclose(patch.barycenter(), [0.0, 0.5, 0.5])
+
+
+@pytest.mark.parametrize("project_barycenter", [True, False])
+def test_frame_vectors_are_writable(project_barycenter):
+    patch = Patch(FAN_VERTICES, FAN_FACES)
+    frame = FrenetFrame.from_patch_and_gate(
+        patch, (FAN_VERTICES[0], FAN_VERTICES[1]), project_barycenter=project_barycenter
+    )
+
+    # Les vecteurs du repere n'aliasent pas le cache du patch
+    frame.n *= -1.0
+    frame.b += 1.0
+    np.testing.assert_allclose(patch.area_weighted_normal(), [0.0, 0.0, 1.0])
+    np.testing.assert_allclose(patch.barycenter(), [0.5, 0.5, 0.0])
+
+
+# ---------------------------------------------------------------------------
+# Construction des reperes par lot
+# ---------------------------------------------------------------------------
+
+@pytest.mark.parametrize("project_barycenter", [True, False])
+def test_batched_frames_match_per_patch(project_barycenter):
+    patches, gates = _random_fans([3, 4, 6, 9, 5])
+    # Gate parallele a la normale : la projection s'annule, repli sur any_tangent_from_normal
+    patches.append(Patch(FAN_VERTICES, FAN_FACES))
+    gates.append((np.zeros(3), np.array([0.0, 0.0, 2.0])))
+
+    batched = FrenetFrame.from_patches_and_gates(patches, gates, project_barycenter)
+    single = [FrenetFrame.from_patch_and_gate(p, g, project_barycenter)
+              for p, g in zip(patches, gates)]
+
+    assert len(batched) == len(patches)
+    for got, expected in zip(batched, single):
+        for name in ("b", "t1", "t2", "n"):
+            np.testing.assert_allclose(getattr(got, name), getattr(expected, name),
+                                       rtol=0, atol=1e-12, err_msg=name)
+
+    # Le repere de repli reste orthonorme
+    np.testing.assert_allclose(batched[-1].basis @ batched[-1].basis.T, np.eye(3), atol=1e-12)
+
+
+def test_batched_frames_input_errors():
+    patches, gates = _random_fans([4, 5])
+
+    assert FrenetFrame.from_patches_and_gates([], []) == []
+    with pytest.raises(ValueError, match="One gate edge is required per patch"):
+        FrenetFrame.from_patches_and_gates(patches, gates[:1])
+    with pytest.raises(ValueError, match="at least one vertex and one face"):
+        FrenetFrame.from_patches_and_gates(
+            [patches[0], Patch(np.zeros((0, 3)), np.zeros((0, 3), dtype=int))], gates
+        )
+
+
+def test_normalize_rows_zeroes_degenerate_rows():
+    v = np.array([[3.0, 0.0, 4.0], [0.0, 0.0, 0.0], [1e-14, 0.0, 0.0]])
+    np.testing.assert_allclose(normalize_rows(v), [[0.6, 0.0, 0.8], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0]])
+
+
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+@pytest.mark.parametrize("project_barycenter", [True, False])
+def test_batched_frames_keep_dtype(dtype, project_barycenter):
+    patches = [Patch(FAN_VERTICES.astype(dtype), FAN_FACES),
+               Patch(FAN_VERTICES[:3].astype(dtype), FAN_FACES[:1])]
+    gates = [(p.vertices[0], p.vertices[1]) for p in patches]
+
+    frames = FrenetFrame.from_patches_and_gates(patches, gates, project_barycenter)
+
+    for frame in frames:
+        for vec in (frame.b, frame.t1, frame.t2, frame.n):
+            assert vec.dtype == dtype
+
+
+# ---------------------------------------------------------------------------
+# Codage / decodage dans les reperes locaux
+# ---------------------------------------------------------------------------
+
+def test_encode_many_decode_many_round_trip():
+    patches, gates = _random_fans([6])
+    frame = FrenetFrame.from_patch_and_gate(patches[0], gates[0])
+    points = np.random.default_rng(2).normal(size=(8, 3))
+
+    # basis empile (t1, t2, n) en lignes, orthonormee
+    np.testing.assert_array_equal(frame.basis, [frame.t1, frame.t2, frame.n])
+    np.testing.assert_allclose(frame.basis @ frame.basis.T, np.eye(3), atol=1e-12)
+
+    coords = LocalEncoder.encode_many(points, frame)
+    expected = [LocalEncoder.encode(vr, frame) for vr in points]
+    np.testing.assert_allclose(coords, expected, rtol=0, atol=1e-12)
+
+    decoded = LocalEncoder.decode_many(coords, frame)
+    expected = [LocalEncoder.decode(*abg, frame) for abg in coords]
+    np.testing.assert_allclose(decoded, expected, rtol=0, atol=1e-12)
+    np.testing.assert_allclose(decoded, points, rtol=0, atol=1e-12)
+
+
+def test_batch_codec_matches_per_patch():
+    # Patchs de tailles differentes : un point a coder par repere
+    patches, gates = _random_fans([3, 7, 4, 10])
+    frames = FrenetFrame.from_patches_and_gates(patches, gates)
+    points = np.random.default_rng(1).normal(size=(len(frames), 3))
+
+    coords = LocalEncoder.encode_batch(points, frames)
+    expected = [LocalEncoder.encode(vr, frame) for vr, frame in zip(points, frames)]
+    np.testing.assert_allclose(coords, expected, rtol=0, atol=1e-12)
+
+    decoded = LocalEncoder.decode_batch(coords, frames)
+    expected = [LocalEncoder.decode(*abg, frame) for abg, frame in zip(coords, frames)]
+    np.testing.assert_allclose(decoded, expected, rtol=0, atol=1e-12)
+
+    # Aller-retour
+    np.testing.assert_allclose(decoded, points, rtol=0, atol=1e-12)
+
+
+def test_batch_codec_input_errors():
+    patches, gates = _random_fans([4, 5])
+    frames = FrenetFrame.from_patches_and_gates(patches, gates)
+
+    assert LocalEncoder.encode_batch(np.zeros((0, 3)), []).shape == (0, 3)
+    assert LocalEncoder.decode_batch(np.zeros((0, 3)), []).shape == (0, 3)
+    with pytest.raises(ValueError, match="One point is required per frame"):
+        LocalEncoder.encode_batch(np.zeros((3, 3)), frames)
+    with pytest.raises(ValueError, match="One coordinate triple is required per frame"):
+        LocalEncoder.decode_batch(np.zeros((1, 3)), frames)
+
+
+# ---------------------------------------------------------------------------
+# Quantification
+# ---------------------------------------------------------------------------
+
+@pytest.mark.parametrize("value", [0.37, np.float32(0.37), np.array(0.37)])
+def test_quantize_scalar_input(value):
+    params = Quantizer.fit([-1.0, 0.37, 1.0], bits=12)
+    q = Quantizer.quantize(value, params)
+
+    # Une entree scalaire donne un scalaire np.int32, comme pour un tableau 0-d
+    assert isinstance(q, np.int32)
+    assert q == np.int32(np.round(0.37 * params.scale))
+
+
+def test_quantize_array_matches_rounding():
+    values = np.array([-1.0, -0.5, 0.0, 0.37, 1.0])
+    params = Quantizer.fit(values, bits=10)
+    q = Quantizer.quantize(values, params)
+
+    assert q.dtype == np.int32 and q.shape == values.shape
+    np.testing.assert_array_equal(q, np.round(values * params.scale).astype(np.int32))
+    # L'entree n'est pas modifiee par les operations en place
+    np.testing.assert_array_equal(values, [-1.0, -0.5, 0.0, 0.37, 1.0])
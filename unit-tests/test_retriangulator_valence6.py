@@ -1,30 +1,11 @@
 import pytest
-from PCLTTM.data_structures.face import Face
 from PCLTTM.data_structures.vertex import Vertex
 from PCLTTM.retriangulator import Retriangulator
 from PCLTTM.mesh import MeshTopology
 from PCLTTM.data_structures.gate import Gate
 from PCLTTM.data_structures.constants import RetriangulationTag
 
-
-def is_face_oriented_correctly(face: Face) -> bool:
-    v1, v2, v3 = face.vertices
-    u = (
-        v2.position[0] - v1.position[0],
-        v2.position[1] - v1.position[1],
-        v2.position[2] - v1.position[2],
-    )
-    v = (
-        v3.position[0] - v1.position[0],
-        v3.position[1] - v1.position[1],
-        v3.position[2] - v1.position[2],
-    )
-    normal = (
-        u[1] * v[2] - u[2] * v[1],
-        u[2] * v[0] - u[0] * v[2],
-        u[0] * v[1] - u[1] * v[0],
-    )
-    return normal[2] > 0  
+from orientation_utils import faces_oriented_correctly
 
 
 @pytest.mark.parametrize(
@@ -71,17 +52,16 @@ def test_retriangulate_valence5_orientation(left_tag, right_tag):
     mesh.add_edge(V3, V4)
     mesh.add_edge(V4, L)
 
-    mesh.set_orientation((R,C),L)
-    mesh.set_orientation((V1,C),R)
-    mesh.set_orientation((V1,V2),C)
-    mesh.set_orientation((V2,V3),C)
-    mesh.set_orientation((V3,V4),C)
-    mesh.set_orientation((C,V4),L)
+    mesh.set_orientation((R,C), (L, None))
+    mesh.set_orientation((V1,C), (R, None))
+    mesh.set_orientation((V1,V2), (C, None))
+    mesh.set_orientation((V2,V3), (C, None))
+    mesh.set_orientation((V3,V4), (C, None))
+    mesh.set_orientation((C,V4), (L, None))
 
     gate = Gate((L, R), C, mesh)
-    patch_oriented = [L, R, V1, V2, V3, V4]
-
-    assert mesh.get_patch(C).surrounding_vertices((L,R)) == patch_oriented
+    patch_oriented = mesh.get_patch(C).surrounding_vertices((L,R))
+    assert patch_oriented == [L, R, V1, V2, V3, V4]
 
     r = Retriangulator()
 
@@ -117,9 +97,10 @@ def test_retriangulate_valence5_orientation(left_tag, right_tag):
         for face in mesh.get_faces(v):
             if face is None:
                 continue
-            key = frozenset(face.vertices)
-            if key in visited:
-                continue
-            visited.add(key)
+            visited.add(face)
 
-            assert is_face_oriented_correctly(face), "Face orientation is incorrect"
+    faces = list(visited)
+    oriented = faces_oriented_correctly(faces)
+    assert oriented.all(), (
+        f"Face orientation is incorrect: {[f for f, ok in zip(faces, oriented) if not ok]}"
+    )
@@ -1,18 +1,36 @@
+import mmap
+import os
+
 import matplotlib.pyplot as plt
+import numpy as np
 from mpl_toolkits.mplot3d import Axes3D
+from mpl_toolkits.mplot3d.art3d import Line3DCollection
+
+from PCLTTM.obja_parser import FACE_INDEX_RE
+
+# Pas d'etiquettes au-dela de ce nombre de sommets (ax.text est tres lent en 3D),
+# None : toujours etiqueter
+MAX_LABELED_VERTICES = None
 
 def load_obj(path):
     vertices = []
     faces = []
 
-    with open(path, 'r') as f:
-        for line in f:
-            if line.startswith('v '):
-                _, x, y, z = line.strip().split()
+    if os.path.getsize(path) == 0:  # mmap refuse les fichiers vides
+        return vertices, faces
+
+    # Lecture binaire via mmap : pas de decodage ni de traduction des fins de ligne,
+    # float() et int() acceptent directement des bytes
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        for line in iter(mm.readline, b''):
+            # Un seul slice par ligne : vn, vt, #, o, s... tombent dans le cas par defaut
+            prefix = line[:2]
+            if prefix == b'v ':
+                _, x, y, z = line.split()
                 vertices.append((float(x), float(y), float(z)))
-            elif line.startswith('f '):
-                parts = line.strip().split()[1:]
-                face = [int(p.split('/')[0]) - 1 for p in parts]
+            elif prefix == b'f ':
+                # Une seule passe regex (en C) sur la ligne au lieu d'un split par element
+                face = [int(i) - 1 for i in FACE_INDEX_RE.findall(line, 2)]
                 faces.append(face)
 
     return vertices, faces
@@ -27,17 +45,19 @@ vertices, faces = load_obj(obj_path)
 fig = plt.figure()
 ax = fig.add_subplot(111, projection='3d')
 
-# Plot faces
-for face in faces:
-    x = [vertices[i][0] for i in face]
-    y = [vertices[i][1] for i in face]
-    z = [vertices[i][2] for i in face]
-    ax.plot(x + [x[0]], y + [y[0]], z + [z[0]])
-
-# Plot vertices + labels
-for i, (x, y, z) in enumerate(vertices):
-    ax.scatter(x, y, z, s=10)
-    ax.text(x, y, z, f"{i}: ({x:.2f}, {y:.2f}, {z:.2f})", fontsize=6)
+# Plot faces : un seul Line3DCollection (contour ferme de chaque face)
+# au lieu d'un ax.plot par face
+verts = np.array(vertices, dtype=float).reshape(-1, 3)
+segments = [verts[face + [face[0]]] for face in faces]
+ax.add_collection3d(Line3DCollection(segments, linewidths=0.5))
+
+# Plot vertices : un seul scatter pour tous les sommets
+ax.scatter(verts[:, 0], verts[:, 1], verts[:, 2], s=10)
+
+# Labels
+if MAX_LABELED_VERTICES is None or len(vertices) <= MAX_LABELED_VERTICES:
+    for i, (x, y, z) in enumerate(vertices):
+        ax.text(x, y, z, f"{i}: ({x:.2f}, {y:.2f}, {z:.2f})", fontsize=6)
 
 ax.set_xlabel('X')
 ax.set_ylabel('Y')